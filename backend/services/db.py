@@ -3,51 +3,344 @@ SQLite Database Service
 Local authentication and data storage using SQLite
 """
 import os
+import asyncio
+import atexit
+import queue
 import sqlite3
 import hashlib
+import logging
 import secrets
+import threading
+import time
 import uuid
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Union, AsyncIterator
+from collections import deque, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
+from pathlib import Path
 
-from config import BASE_DIR
+from config import BASE_DIR, DB_READ_POOL_SIZE
 
 
+logger = logging.getLogger(__name__)
+
 # Database path
 DB_PATH = os.path.join(BASE_DIR, "signlanguage.db")
 
+# Applied once when the writer connection is opened
+_WRITER_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA analysis_limit=1000",    # keep ANALYZE/optimize cheap on large tables
+    "PRAGMA optimize",
+)
+
+# Applied to every connection (writer and pooled readers)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",      # ~64 MB page cache
+    "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped I/O
+)
+
+# Password hashing: new rows store the raw scrypt digest and a raw 32-byte
+# salt as BLOBs. TEXT hashes are legacy PBKDF2-SHA256 hex digests and are
+# upgraded on next sign-in.
+_SCRYPT_N = 16384
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SCRYPT_DKLEN = 32
+_SALT_BYTES = 32
+_PBKDF2_ITERATIONS = 100000
+
+# Session lifetime in seconds (7 days)
+_SESSION_TTL = 604800
+
+# Verified-session cache: bounds revocation lag for sessions removed
+# outside sign_out and delete_user (e.g. expiry)
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX = 4096
+_BAD_TOKEN_CACHE_MAX = 2048
+
+# Group commit for translation history: rows queued while a batch is
+# being written go into the next batch (one transaction each)
+_TRANSLATION_BATCH_SIZE = 256
+
+# Column order of the 'get_translations' statement
+_TRANSLATION_KEYS = ('id', 'sign_label', 'confidence', 'gesture_type', 'created_at')
+
+# Rows fetched per round trip when streaming history
+_STREAM_BATCH_SIZE = 128
+
+# Per-connection prepared statement cache size (sqlite3 default is 128)
+_STATEMENT_CACHE_SIZE = 256
+
+# Hot-path statements, kept as fixed strings so sqlite3's statement
+# cache reuses the prepared statement instead of reparsing the SQL.
+_STATEMENTS = {
+    'get_user_by_token': """
+        SELECT u.id, u.email, u.created_at, s.expires_at
+        FROM users u
+        JOIN sessions s ON u.id = s.user_id
+        WHERE s.token = ? AND s.expires_at > ?
+    """,
+    'insert_session': """
+        INSERT INTO sessions (id, user_id, token, expires_at)
+        VALUES (?, ?, ?, ?)
+    """,
+    # id is left to SQLite (INTEGER PRIMARY KEY), so concurrent writers
+    # can never collide
+    'insert_translation': """
+        INSERT INTO translations (user_id, sign_label, confidence, gesture_type)
+        VALUES (?, ?, ?, ?)
+    """,
+    # One pass over the user's slice of the covering index
+    'translation_stats': """
+        SELECT COUNT(*) AS total,
+               COUNT(CASE WHEN created_at >= date('now') THEN 1 END) AS today,
+               COUNT(DISTINCT sign_label) AS unique_signs
+        FROM translations
+        WHERE user_id = ?
+    """,
+    'get_translations': """
+        SELECT id, sign_label, confidence, gesture_type, created_at
+        FROM translations
+        WHERE user_id = ?
+        ORDER BY created_at DESC
+        LIMIT ? OFFSET ?
+    """,
+    # Streaming pages: id breaks created_at ties so each page can resume
+    # strictly after the last row of the previous one
+    'stream_translations': """
+        SELECT id, sign_label, confidence, gesture_type, created_at
+        FROM translations
+        WHERE user_id = ?
+        ORDER BY created_at DESC, id DESC
+        LIMIT ? OFFSET ?
+    """,
+    'stream_translations_after': """
+        SELECT id, sign_label, confidence, gesture_type, created_at
+        FROM translations
+        WHERE user_id = ? AND (created_at, id) < (?, ?)
+        ORDER BY created_at DESC, id DESC
+        LIMIT ?
+    """,
+}
+
+
+# Dedicated workers for password KDFs. hashlib releases the GIL while
+# hashing; the small pool caps concurrent scrypt memory use and keeps
+# logins from occupying the default executor used for database I/O.
+_HASH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="password-hash")
+atexit.register(_HASH_POOL.shutdown, wait=False)
+
+
+def _scrypt(password: bytes, salt: bytes) -> bytes:
+    """Raw scrypt digest."""
+    return hashlib.scrypt(password, salt=salt, n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P, dklen=_SCRYPT_DKLEN)
+
+
+def _pbkdf2(password: bytes, salt: bytes) -> bytes:
+    """Raw legacy PBKDF2-SHA256 digest."""
+    return hashlib.pbkdf2_hmac('sha256', password, salt, _PBKDF2_ITERATIONS)
+
+
+def _hash_password_static(password: str, salt: bytes) -> bytes:
+    """Derive the raw scrypt hash for a password."""
+    return _scrypt(password.encode('utf-8'), salt)
+
+
+def _verify_password_static(
+    password: str,
+    password_hash: Union[bytes, str],
+    salt: Union[bytes, str]
+) -> bool:
+    """Check a password against a scrypt BLOB or legacy PBKDF2 hex hash."""
+    password_bytes = password.encode('utf-8')
+    
+    if isinstance(password_hash, bytes):
+        return secrets.compare_digest(_scrypt(password_bytes, salt), password_hash)
+    
+    # Legacy PBKDF2-SHA256 hex digest, salted with the hex salt string
+    expected = bytes.fromhex(password_hash)
+    computed = _pbkdf2(password_bytes, salt.encode('utf-8'))
+    return secrets.compare_digest(computed, expected)
+
 
 class DatabaseService:
     """SQLite database service for users, authentication, and translations."""
     
-    _instance: Optional['DatabaseService'] = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    __slots__ = (
+        '_conn', '_conn_lock',
+        '_read_pool', '_read_conns_opened', '_read_pool_lock',
+        '_token_cache', '_bad_tokens', '_token_lock', '_token_generation',
+        '_write_queue', '_flush_lock', '_flush_pending', '_flusher',
+    )
     
     def __init__(self):
-        if self._initialized:
-            return
-        self._initialized = True
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.RLock()
+        self._read_pool: queue.Queue = queue.Queue(maxsize=DB_READ_POOL_SIZE)
+        self._read_conns_opened = 0
+        self._read_pool_lock = threading.Lock()
+        self._token_cache: Dict[bytes, tuple] = {}  # sha256(token) -> (valid_until, user)
+        self._bad_tokens: OrderedDict = OrderedDict()  # sha256(token) -> retry_after
+        self._token_lock = threading.Lock()  # guards both token caches
+        # Bumped on every revocation; lookups that overlap one don't cache
+        self._token_generation = 0
+        
+        # Queue of (row, Future) translation inserts; each future receives
+        # the row's id once it is committed
+        self._write_queue: deque = deque()
+        self._flush_lock = threading.Lock()
+        self._flush_pending = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        
         self._init_database()
+        atexit.register(self.flush)
     
-    @contextmanager
-    def _get_connection(self):
-        """Get a database connection with context management."""
-        conn = sqlite3.connect(DB_PATH)
+    def _open_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a long-lived connection and apply performance pragmas."""
+        if read_only:
+            uri = f"{Path(DB_PATH).as_uri()}?mode=ro"
+            conn = sqlite3.connect(
+                uri, uri=True, check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE
+            )
+        else:
+            conn = sqlite3.connect(
+                DB_PATH, check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE
+            )
+            for pragma in _WRITER_PRAGMAS:
+                conn.execute(pragma)
         conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _get_read_conn(self):
+        """Check out a read-only connection from the pool.
+        
+        Readers never block on the writer under WAL; connections are
+        opened on demand up to DB_READ_POOL_SIZE and then reused.
+        """
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            with self._read_pool_lock:
+                can_open = self._read_conns_opened < DB_READ_POOL_SIZE
+                if can_open:
+                    self._read_conns_opened += 1
+            if can_open:
+                try:
+                    conn = self._open_connection(read_only=True)
+                except Exception:
+                    with self._read_pool_lock:
+                        self._read_conns_opened -= 1
+                    raise
+            else:
+                conn = self._read_pool.get()
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
         finally:
-            conn.close()
+            self._read_pool.put(conn)
+    
+    @contextmanager
+    def _get_connection(self):
+        """Get the shared writer connection inside a transaction.
+        
+        The connection is opened lazily and reused so SQLite's page cache
+        stays warm; commit/rollback is handled by the connection context.
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                self._conn = self._open_connection()
+            with self._conn:
+                yield self._conn
+    
+    async def _run(self, fn, *args):
+        """Run blocking database work in a worker thread."""
+        return await asyncio.to_thread(fn, *args)
+    
+    @staticmethod
+    def _exec(conn: sqlite3.Connection, name: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Execute a named statement from the prepared statement table."""
+        return conn.execute(_STATEMENTS[name], params)
+    
+    @staticmethod
+    def _exec_tuples(conn: sqlite3.Connection, name: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Execute a named statement on a cursor that yields plain tuples."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(_STATEMENTS[name], params)
+    
+    def _start_flusher(self):
+        """Start the background thread that drains the write queue."""
+        with self._flush_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="translation-flusher", daemon=True
+                )
+                self._flusher.start()
+    
+    def _flush_loop(self):
+        """Flush queued translations as soon as they arrive."""
+        while True:
+            self._flush_pending.wait()
+            self._flush_pending.clear()
+            self.flush()
+    
+    def flush(self):
+        """Write all queued translations to the database in batches.
+        
+        Each batch is one transaction; every queued row's future is
+        resolved with its SQLite-assigned id (or the insert error). If a
+        batch fails, its rows are retried one transaction each, so a bad
+        row cannot take the rest of its batch down with it.
+        """
+        with self._flush_lock:
+            while self._write_queue:
+                batch = []
+                while self._write_queue and len(batch) < _TRANSLATION_BATCH_SIZE:
+                    row, waiter = self._write_queue.popleft()
+                    # Once running, a future can't be cancelled under us; a
+                    # cancelled caller's row is still written
+                    if not waiter.set_running_or_notify_cancel():
+                        waiter = None
+                    batch.append((row, waiter))
+                try:
+                    ids = self._insert_translations([row for row, _ in batch])
+                except Exception:
+                    logger.warning(
+                        "Batch of %d translations failed; retrying row by row",
+                        len(batch), exc_info=True
+                    )
+                    for row, waiter in batch:
+                        try:
+                            translation_id = self._insert_translations([row])[0]
+                        except Exception as e:
+                            logger.error("Error saving translation %r: %s", row, e)
+                            if waiter is not None:
+                                waiter.set_exception(e)
+                        else:
+                            if waiter is not None:
+                                waiter.set_result(translation_id)
+                else:
+                    for (_, waiter), translation_id in zip(batch, ids):
+                        if waiter is not None:
+                            waiter.set_result(translation_id)
+    
+    def _insert_translations(self, rows: List[tuple]) -> List[int]:
+        """Insert rows in one transaction and return their ids."""
+        statement = _STATEMENTS['insert_translation']
+        with self._get_connection() as conn:
+            return [conn.execute(statement, row).lastrowid for row in rows]
+    
+    @staticmethod
+    def _token_key(token: str) -> bytes:
+        """Cache key for a session token (avoids holding raw tokens)."""
+        return hashlib.sha256(token.encode('utf-8')).digest()
     
     def _init_database(self):
         """Initialize database tables."""
@@ -59,28 +352,28 @@ class DatabaseService:
                 CREATE TABLE IF NOT EXISTS users (
                     id TEXT PRIMARY KEY,
                     email TEXT UNIQUE NOT NULL,
-                    password_hash TEXT NOT NULL,
-                    salt TEXT NOT NULL,
+                    password_hash BLOB NOT NULL,
+                    salt BLOB NOT NULL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
             
-            # Sessions table
+            # Sessions table (expires_at is unix epoch seconds)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS sessions (
                     id TEXT PRIMARY KEY,
                     user_id TEXT NOT NULL,
                     token TEXT UNIQUE NOT NULL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    expires_at TIMESTAMP NOT NULL,
+                    expires_at INTEGER NOT NULL,
                     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
                 )
             """)
             
-            # Translations table
+            # Translations table (INTEGER PRIMARY KEY aliases the rowid)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS translations (
-                    id TEXT PRIMARY KEY,
+                    id INTEGER PRIMARY KEY,
                     user_id TEXT NOT NULL,
                     sign_label TEXT NOT NULL,
                     confidence REAL NOT NULL,
@@ -90,13 +383,63 @@ class DatabaseService:
                 )
             """)
             
+            # Convert legacy datetime-text expiries to epoch integers
+            cursor.execute("""
+                UPDATE sessions
+                SET expires_at = CAST(strftime('%s', expires_at) AS INTEGER)
+                WHERE typeof(expires_at) = 'text'
+            """)
+            
+            self._migrate_translation_ids(conn)
+            
             # Create indexes
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_translations_user_id ON translations(user_id)")
+            # Covering index: get_translations is answered from the index alone
+            cursor.execute("DROP INDEX IF EXISTS idx_translations_user_id")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_translations_user_created
+                ON translations(user_id, created_at DESC, sign_label, confidence, gesture_type)
+            """)
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_translations_created_at ON translations(created_at DESC)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_token ON sessions(token)")
+            cursor.execute("DROP INDEX IF EXISTS idx_sessions_token")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_token_exp ON sessions(token, expires_at)")
+            
+            # Refresh planner statistics for the indexes above
+            cursor.execute("ANALYZE")
             
             print("✅ SQLite database initialized")
     
+    def _migrate_translation_ids(self, conn: sqlite3.Connection):
+        """Rebuild a legacy translations table that used TEXT UUID keys."""
+        columns = conn.execute("PRAGMA table_info(translations)").fetchall()
+        id_type = next((c['type'] for c in columns if c['name'] == 'id'), None)
+        if id_type is None or id_type.upper() == 'INTEGER':
+            return
+        
+        # Plain execute() calls so the rebuild stays inside the caller's
+        # transaction (executescript would commit it first); DDL does not
+        # open a transaction implicitly, so make sure one is open
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        conn.execute("ALTER TABLE translations RENAME TO translations_legacy")
+        conn.execute("""
+            CREATE TABLE translations (
+                id INTEGER PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                sign_label TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                gesture_type TEXT DEFAULT 'static',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+            )
+        """)
+        conn.execute("""
+            INSERT INTO translations (user_id, sign_label, confidence, gesture_type, created_at)
+            SELECT user_id, sign_label, confidence, gesture_type, created_at
+            FROM translations_legacy ORDER BY created_at
+        """)
+        conn.execute("DROP TABLE translations_legacy")
+        print("✅ Migrated translations table to integer ids")
+    
     @property
     def is_connected(self) -> bool:
         """Always connected for SQLite."""
@@ -104,30 +447,38 @@ class DatabaseService:
     
     # ==================== PASSWORD HASHING ====================
     
-    def _hash_password(self, password: str, salt: str = None) -> tuple:
-        """Hash password with salt."""
+    def _hash_password(self, password: str, salt: bytes = None) -> tuple:
+        """Hash password with a random binary salt using scrypt."""
         if salt is None:
-            salt = secrets.token_hex(32)
-        
-        # Use PBKDF2 for secure password hashing
-        password_hash = hashlib.pbkdf2_hmac(
-            'sha256',
-            password.encode('utf-8'),
-            salt.encode('utf-8'),
-            100000  # iterations
-        ).hex()
+            salt = secrets.token_bytes(_SALT_BYTES)
         
+        password_hash = _HASH_POOL.submit(_hash_password_static, password, salt).result()
         return password_hash, salt
     
-    def _verify_password(self, password: str, password_hash: str, salt: str) -> bool:
-        """Verify password against hash."""
-        computed_hash, _ = self._hash_password(password, salt)
-        return secrets.compare_digest(computed_hash, password_hash)
+    def _verify_password(
+        self,
+        password: str,
+        password_hash: Union[bytes, str],
+        salt: Union[bytes, str]
+    ) -> bool:
+        """Verify password against a stored hash."""
+        return _HASH_POOL.submit(
+            _verify_password_static, password, password_hash, salt
+        ).result()
+    
+    @staticmethod
+    def _needs_rehash(password_hash: Union[bytes, str]) -> bool:
+        """Check if a stored hash is a legacy PBKDF2 TEXT digest."""
+        return not isinstance(password_hash, bytes)
     
     # ==================== AUTH OPERATIONS ====================
     
     async def sign_up(self, email: str, password: str) -> Dict[str, Any]:
         """Register a new user."""
+        return await self._run(self._sync_sign_up, email, password)
+    
+    def _sync_sign_up(self, email: str, password: str) -> Dict[str, Any]:
+        """Blocking implementation of sign_up."""
         try:
             email = email.lower().strip()
             
@@ -175,28 +526,43 @@ class DatabaseService:
     
     async def sign_in(self, email: str, password: str) -> Dict[str, Any]:
         """Sign in existing user."""
+        return await self._run(self._sync_sign_in, email, password)
+    
+    def _sync_sign_in(self, email: str, password: str) -> Dict[str, Any]:
+        """Blocking implementation of sign_in.
+        
+        The password KDF runs without holding any connection; the writer
+        is only taken to store an upgraded hash.
+        """
         try:
             email = email.lower().strip()
             
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Find user
-                cursor.execute("""
+            # Find user
+            with self._get_read_conn() as conn:
+                row = conn.execute("""
                     SELECT id, email, password_hash, salt 
                     FROM users WHERE email = ?
-                """, (email,))
-                row = cursor.fetchone()
-                
-                if not row:
-                    return {"error": "Invalid email or password"}
-                
-                # Verify password
-                if not self._verify_password(password, row['password_hash'], row['salt']):
-                    return {"error": "Invalid email or password"}
-                
-                user_id = row['id']
-                user_email = row['email']
+                """, (email,)).fetchone()
+            
+            if not row:
+                return {"error": "Invalid email or password"}
+            
+            # Verify password
+            if not self._verify_password(password, row['password_hash'], row['salt']):
+                return {"error": "Invalid email or password"}
+            
+            user_id = row['id']
+            user_email = row['email']
+            
+            # Transparently upgrade legacy hashes
+            if self._needs_rehash(row['password_hash']):
+                password_hash, salt = self._hash_password(password)
+                with self._get_connection() as conn:
+                    # Skip if the hash changed since it was read
+                    conn.execute("""
+                        UPDATE users SET password_hash = ?, salt = ?
+                        WHERE id = ? AND password_hash = ?
+                    """, (password_hash, salt, user_id, row['password_hash']))
             
             # Create session
             session = self._create_session(user_id)
@@ -216,14 +582,13 @@ class DatabaseService:
         """Create a new session for user."""
         session_id = str(uuid.uuid4())
         token = secrets.token_urlsafe(32)
-        expires_at = datetime.now().timestamp() + (7 * 24 * 60 * 60)  # 7 days
+        expires_at = int(time.time()) + _SESSION_TTL
         
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO sessions (id, user_id, token, expires_at)
-                VALUES (?, ?, ?, datetime(?, 'unixepoch'))
-            """, (session_id, user_id, token, expires_at))
+            self._exec(conn, 'insert_session', (session_id, user_id, token, expires_at))
+        key = self._token_key(token)
+        with self._token_lock:
+            self._bad_tokens.pop(key, None)
         
         return {
             "token": token,
@@ -232,11 +597,41 @@ class DatabaseService:
     
     async def sign_out(self, token: str = None) -> Dict[str, Any]:
         """Sign out current user (invalidate session)."""
+        return await self._run(self._sync_sign_out, token)
+    
+    def _sync_sign_out(self, token: str = None) -> Dict[str, Any]:
+        """Blocking implementation of sign_out."""
         try:
             if token:
                 with self._get_connection() as conn:
                     cursor = conn.cursor()
                     cursor.execute("DELETE FROM sessions WHERE token = ?", (token,))
+                key = self._token_key(token)
+                with self._token_lock:
+                    self._token_generation += 1
+                    self._token_cache.pop(key, None)
+            return {"success": True}
+        except Exception as e:
+            return {"error": str(e)}
+    
+    async def delete_user(self, user_id: str) -> Dict[str, Any]:
+        """Delete a user with their sessions and translations."""
+        return await self._run(self._sync_delete_user, user_id)
+    
+    def _sync_delete_user(self, user_id: str) -> Dict[str, Any]:
+        """Blocking implementation of delete_user."""
+        try:
+            self.flush()
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("DELETE FROM sessions WHERE user_id = ?", (user_id,))
+                cursor.execute("DELETE FROM translations WHERE user_id = ?", (user_id,))
+                cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
+            with self._token_lock:
+                self._token_generation += 1
+                stale = [key for key, (_, user) in self._token_cache.items() if user["id"] == user_id]
+                for key in stale:
+                    del self._token_cache[key]
             return {"success": True}
         except Exception as e:
             return {"error": str(e)}
@@ -246,26 +641,51 @@ class DatabaseService:
         if not token:
             return None
         
+        key = self._token_key(token)
+        now = time.time()
+        with self._token_lock:
+            generation = self._token_generation
+            cached = self._token_cache.get(key)
+            if cached is not None:
+                valid_until, user = cached
+                if valid_until > now:
+                    return dict(user)
+                self._token_cache.pop(key, None)
+            
+            # Known-bad tokens are denied without touching the database
+            retry_after = self._bad_tokens.get(key)
+            if retry_after is not None:
+                if retry_after > now:
+                    return None
+                self._bad_tokens.pop(key, None)
+        
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT u.id, u.email, u.created_at 
-                    FROM users u
-                    JOIN sessions s ON u.id = s.user_id
-                    WHERE s.token = ? AND s.expires_at > datetime('now')
-                """, (token,))
-                row = cursor.fetchone()
-                
-                if row:
-                    return {
-                        "id": row['id'],
-                        "email": row['email'],
-                        "created_at": row['created_at']
-                    }
-                return None
+            with self._get_read_conn() as conn:
+                row = self._exec(conn, 'get_user_by_token', (token, int(now))).fetchone()
         except Exception:
             return None
+        
+        # The lock is not held across the query; the caches are only
+        # updated once the result is known. A session revoked while the
+        # query ran may still be in the row, so it is not cached.
+        with self._token_lock:
+            if row:
+                user = {
+                    "id": row['id'],
+                    "email": row['email'],
+                    "created_at": row['created_at']
+                }
+                if generation == self._token_generation:
+                    valid_until = min(row['expires_at'], now + _TOKEN_CACHE_TTL)
+                    if len(self._token_cache) >= _TOKEN_CACHE_MAX:
+                        self._token_cache.pop(next(iter(self._token_cache)), None)
+                    self._token_cache[key] = (valid_until, user)
+                return dict(user)
+            
+            self._bad_tokens[key] = now + _TOKEN_CACHE_TTL
+            if len(self._bad_tokens) > _BAD_TOKEN_CACHE_MAX:
+                self._bad_tokens.popitem(last=False)
+            return None
     
     # ==================== TRANSLATION OPERATIONS ====================
     
@@ -276,17 +696,23 @@ class DatabaseService:
         confidence: float,
         gesture_type: str = "static"
     ) -> Dict[str, Any]:
-        """Save a translation to history."""
+        """Save a translation to history.
+        
+        Rows are written in batches by a background thread (saves that
+        arrive while a batch is being written share the next commit);
+        this returns once the row is committed, with the id SQLite
+        assigned to it.
+        """
         try:
-            translation_id = str(uuid.uuid4())
-            
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO translations (id, user_id, sign_label, confidence, gesture_type)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (translation_id, user_id, sign_label, confidence, gesture_type))
+            waiter: Future = Future()
+            self._write_queue.append(
+                ((user_id, sign_label, confidence, gesture_type), waiter)
+            )
+            if self._flusher is None:
+                self._start_flusher()
+            self._flush_pending.set()
             
+            translation_id = await asyncio.wrap_future(waiter)
             return {"success": True, "id": translation_id}
         except Exception as e:
             return {"error": str(e)}
@@ -298,61 +724,109 @@ class DatabaseService:
         offset: int = 0
     ) -> List[Dict[str, Any]]:
         """Get user's translation history."""
+        return await self._run(self._sync_get_translations, user_id, limit, offset)
+    
+    def _sync_get_translations(
+        self, 
+        user_id: str, 
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Blocking implementation of get_translations."""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT id, sign_label, confidence, gesture_type, created_at
-                    FROM translations
-                    WHERE user_id = ?
-                    ORDER BY created_at DESC
-                    LIMIT ? OFFSET ?
-                """, (user_id, limit, offset))
-                
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+            self.flush()
+            with self._get_read_conn() as conn:
+                rows = self._exec_tuples(
+                    conn, 'get_translations', (user_id, limit, offset)
+                ).fetchall()
+                return [dict(zip(_TRANSLATION_KEYS, row)) for row in rows]
         except Exception as e:
             print(f"Error fetching translations: {e}")
             return []
     
+    async def iter_translations(
+        self,
+        user_id: str,
+        limit: int = -1,
+        offset: int = 0,
+        batch_size: int = _STREAM_BATCH_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a user's translation history (newest first).
+        
+        Rows are fetched a page at a time on a worker thread and yielded
+        one at a time, so large histories (exports) are never materialized
+        as a full list. Each page checks a read connection out and back in
+        on the worker thread; no connection is held while the caller
+        consumes rows. A negative limit means no limit.
+        """
+        await self._run(self.flush)
+        remaining = limit
+        last_row = None
+        while remaining:
+            size = batch_size if remaining < 0 else min(batch_size, remaining)
+            batch = await self._run(
+                self._fetch_translation_page, user_id, size, offset, last_row
+            )
+            for row in batch:
+                yield dict(zip(_TRANSLATION_KEYS, row))
+            if len(batch) < size:
+                break
+            last_row = batch[-1]
+            if remaining > 0:
+                remaining -= size
+    
+    def _fetch_translation_page(
+        self,
+        user_id: str,
+        size: int,
+        offset: int,
+        last_row: Optional[tuple]
+    ) -> List[tuple]:
+        """Fetch one page for iter_translations (blocking).
+        
+        The first page applies `offset`; later pages continue after
+        `last_row`, the final row of the previous page.
+        """
+        with self._get_read_conn() as conn:
+            if last_row is None:
+                cursor = self._exec_tuples(
+                    conn, 'stream_translations', (user_id, size, offset)
+                )
+            else:
+                cursor = self._exec_tuples(
+                    conn, 'stream_translations_after',
+                    (user_id, last_row[4], last_row[0], size)
+                )
+            return cursor.fetchall()
+    
     async def get_translation_stats(self, user_id: str) -> Dict[str, Any]:
         """Get user's translation statistics."""
+        return await self._run(self._sync_get_translation_stats, user_id)
+    
+    def _sync_get_translation_stats(self, user_id: str) -> Dict[str, Any]:
+        """Blocking implementation of get_translation_stats."""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Total count
-                cursor.execute("""
-                    SELECT COUNT(*) as total FROM translations WHERE user_id = ?
-                """, (user_id,))
-                total = cursor.fetchone()['total']
-                
-                # Today's count
-                cursor.execute("""
-                    SELECT COUNT(*) as today FROM translations 
-                    WHERE user_id = ? AND date(created_at) = date('now')
-                """, (user_id,))
-                today = cursor.fetchone()['today']
-                
-                # Unique signs
-                cursor.execute("""
-                    SELECT COUNT(DISTINCT sign_label) as unique_signs 
-                    FROM translations WHERE user_id = ?
-                """, (user_id,))
-                unique_signs = cursor.fetchone()['unique_signs']
+            self.flush()
+            with self._get_read_conn() as conn:
+                row = self._exec(conn, 'translation_stats', (user_id,)).fetchone()
                 
                 return {
-                    "total": total,
-                    "today": today,
-                    "unique_signs": unique_signs
+                    "total": row['total'],
+                    "today": row['today'],
+                    "unique_signs": row['unique_signs']
                 }
         except Exception as e:
             print(f"Error getting stats: {e}")
             return {"total": 0, "today": 0, "unique_signs": 0}
     
-    async def delete_translation(self, translation_id: str, user_id: str) -> Dict[str, Any]:
+    async def delete_translation(self, translation_id: int, user_id: str) -> Dict[str, Any]:
         """Delete a translation record."""
+        return await self._run(self._sync_delete_translation, translation_id, user_id)
+    
+    def _sync_delete_translation(self, translation_id: int, user_id: str) -> Dict[str, Any]:
+        """Blocking implementation of delete_translation."""
         try:
+            self.flush()
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -365,7 +839,12 @@ class DatabaseService:
     
     async def clear_history(self, user_id: str) -> Dict[str, Any]:
         """Clear all translation history for a user."""
+        return await self._run(self._sync_clear_history, user_id)
+    
+    def _sync_clear_history(self, user_id: str) -> Dict[str, Any]:
+        """Blocking implementation of clear_history."""
         try:
+            self.flush()
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM translations WHERE user_id = ?", (user_id,))
@@ -374,5 +853,5 @@ class DatabaseService:
             return {"error": str(e)}
 
 
-# Global instance
+# Global instance (create once; other modules import this)
 db = DatabaseService()
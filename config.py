@@ -83,6 +83,12 @@ SIGN_DISPLAY_DURATION = 1.5      # Seconds to display each word sign
 LETTER_DISPLAY_DURATION = 0.5    # Seconds to display each letter
 FINGERSPELL_SPEED = 0.4          # Seconds per letter when fingerspelling
 
+# ============================================================
+# DATABASE SETTINGS
+# ============================================================
+
+DB_READ_POOL_SIZE = 4            # Read-only SQLite connections (WAL readers)
+
 # ============================================================
 # VIDEO PROCESSING SETTINGS
 # ============================================================
@@ -4,32 +4,87 @@ Gesture Sequence - Data structures for temporal gesture representation
 This module defines the core data structures used throughout the
 sign language processing pipeline to represent gestures over time.
 """
+import json
 import time
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
-from enum import Enum
+from enum import IntEnum
 import numpy as np
 
+# Optional fast JSON encoder (serializes numpy arrays natively)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class GestureType(Enum):
+
+# Shape of a single hand's landmark array (21 points x 3 coords)
+LANDMARK_SHAPE = (21, 3)
+
+
+# Serialized names, indexed by GestureType / GestureConfidence value
+_GESTURE_TYPE_NAMES = ("static", "dynamic", "word", "phrase", "transition", "unknown")
+_CONFIDENCE_NAMES = ("uncertain", "low", "medium", "high")
+
+# Lower bounds of the LOW, MEDIUM and HIGH confidence buckets
+_CONFIDENCE_BINS = np.array([0.45, 0.65, 0.85])
+
+
+class GestureType(IntEnum):
     """Types of gestures recognized by the system."""
-    STATIC = "static"           # Static hand pose (letters, numbers)
-    DYNAMIC = "dynamic"         # Movement-based gesture (J, Z, wave)
-    WORD = "word"               # Complete word gesture
-    PHRASE = "phrase"           # Multi-word phrase gesture
-    TRANSITION = "transition"   # Transitional movement between gestures
-    UNKNOWN = "unknown"
+    STATIC = 0          # Static hand pose (letters, numbers)
+    DYNAMIC = 1         # Movement-based gesture (J, Z, wave)
+    WORD = 2            # Complete word gesture
+    PHRASE = 3          # Multi-word phrase gesture
+    TRANSITION = 4      # Transitional movement between gestures
+    UNKNOWN = 5
+    
+    @property
+    def label(self) -> str:
+        """Serialized name (e.g. "static")."""
+        return _GESTURE_TYPE_NAMES[self]
+
+
+class GestureConfidence(IntEnum):
+    """Confidence levels for gesture recognition (ordered low to high)."""
+    UNCERTAIN = 0   # < 0.45
+    LOW = 1         # 0.45 - 0.65
+    MEDIUM = 2      # 0.65 - 0.85
+    HIGH = 3        # > 0.85
+    
+    @property
+    def label(self) -> str:
+        """Serialized name (e.g. "high")."""
+        return _CONFIDENCE_NAMES[self]
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for numpy values when orjson is unavailable."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
-class GestureConfidence(Enum):
-    """Confidence levels for gesture recognition."""
-    HIGH = "high"        # > 0.85
-    MEDIUM = "medium"    # 0.65 - 0.85
-    LOW = "low"          # 0.45 - 0.65
-    UNCERTAIN = "uncertain"  # < 0.45
+def dumps_json(data: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, default=_json_default, separators=(',', ':')).encode('utf-8')
 
 
-@dataclass
+def confidence_levels(confidences: np.ndarray) -> np.ndarray:
+    """Vectorized confidence bucketing.
+    
+    Args:
+        confidences: Array of confidence values
+        
+    Returns:
+        int8 array of GestureConfidence values
+    """
+    return np.digitize(confidences, _CONFIDENCE_BINS).astype(np.int8)
+
+
+@dataclass(slots=True)
 class GestureFrame:
     """A single frame of gesture data with landmarks and predictions.
     
@@ -75,14 +130,27 @@ class GestureFrame:
             'frame_id': self.frame_id,
             'predicted_label': self.predicted_label,
             'confidence': self.confidence,
-            'gesture_type': self.gesture_type.value,
+            'gesture_type': _GESTURE_TYPE_NAMES[self.gesture_type],
             'hand_detected': self.hand_detected,
             'handedness': self.handedness,
             'metadata': self.metadata
         }
+    
+    def to_json_bytes(self, include_landmarks: bool = False) -> bytes:
+        """Serialize straight to JSON bytes.
+        
+        Args:
+            include_landmarks: Also emit the raw landmark array (numpy
+                arrays are encoded without an intermediate tolist()
+                when orjson is installed)
+        """
+        data = self.to_dict()
+        if include_landmarks:
+            data['landmarks'] = self.landmarks
+        return dumps_json(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class RecognizedGesture:
     """A gesture recognized from temporal analysis of multiple frames.
     
@@ -123,7 +191,7 @@ class RecognizedGesture:
         return GestureConfidence.UNCERTAIN
 
 
-@dataclass
+@dataclass(slots=True)
 class GestureSequence:
     """A sequence of recognized gestures forming a translation unit.
     
@@ -190,7 +258,7 @@ class GestureSequence:
             'gestures': [
                 {
                     'label': g.label,
-                    'type': g.gesture_type.value,
+                    'type': _GESTURE_TYPE_NAMES[g.gesture_type],
                     'confidence': g.confidence,
                     'duration': g.duration,
                     'meaning': g.semantic_meaning
@@ -201,9 +269,13 @@ class GestureSequence:
             'translated_text': self.translated_text,
             'confidence': self.translation_confidence
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes."""
+        return dumps_json(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
     """Final translation result from sign language to text.
     
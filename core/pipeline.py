@@ -14,24 +14,30 @@ Supports:
 - Manual stop/translate mode
 - Text-to-sign reverse translation
 """
+import sys
 import time
 import threading
+from collections import deque
 from typing import Optional, Callable, Dict, Any, Tuple, List
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from queue import Queue, Empty
+from functools import lru_cache
+from queue import Queue, Full
 
 import numpy as np
 
 from .temporal_aggregator import TemporalAggregator, AggregationState
 from .sentence_constructor import SentenceConstructor, ContinuousSentenceBuilder
-from .sign_vocabulary import SignVocabulary
+from .sign_vocabulary import SignVocabulary, WORDLIKE_CATEGORIES
 from .text_to_sign import TextToSignTranslator, SignSequenceResult
 from .gesture_sequence import (
     GestureFrame, RecognizedGesture, GestureSequence,
-    GestureType, TranslationResult
+    GestureType, TranslationResult, LANDMARK_SHAPE
 )
 
+# How often a producer blocked on a full async queue checks for shutdown
+_SUBMIT_POLL_INTERVAL = 0.1
+
 
 class PipelineMode(Enum):
     """Operating modes for the pipeline."""
@@ -49,7 +55,7 @@ class TranslationMode(Enum):
     WORD = "word"             # Output complete words
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Configuration for the processing pipeline."""
     # Temporal aggregation
@@ -67,6 +73,11 @@ class PipelineConfig:
     
     # Input settings
     target_fps: int = 30
+    feature_dim: int = 68  # 21*3 normalized coords + 5 finger distances
+    
+    # Threading (live modes): capture -> aggregator thread -> sentence thread
+    async_mode: bool = False
+    async_queue_size: int = 4
     
     # Feature flags
     enable_word_recognition: bool = True
@@ -74,23 +85,39 @@ class PipelineConfig:
     enable_heuristics: bool = True
 
 
-@dataclass 
+@dataclass(slots=True, init=False)
 class PipelineState:
     """Current state of the pipeline."""
-    mode: PipelineMode = PipelineMode.IDLE
-    is_processing: bool = False
-    frames_processed: int = 0
-    gestures_recognized: int = 0
+    mode: PipelineMode
+    is_processing: bool
+    frames_processed: int
+    gestures_recognized: int
     
     # Current output
-    current_text: str = ""
-    current_preview: str = ""
-    last_gesture: Optional[str] = None
-    last_confidence: float = 0.0
+    current_text: str
+    current_preview: str
+    last_gesture: Optional[str]
+    last_confidence: float
     
     # Timing
-    start_time: float = 0.0
-    last_update_time: float = 0.0
+    start_time: float
+    last_update_time: float
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Reset all fields in place (plain slot stores)."""
+        self.mode = PipelineMode.IDLE
+        self.is_processing = False
+        self.frames_processed = 0
+        self.gestures_recognized = 0
+        self.current_text = ""
+        self.current_preview = ""
+        self.last_gesture = None
+        self.last_confidence = 0.0
+        self.start_time = 0.0
+        self.last_update_time = 0.0
 
 
 class SignLanguagePipeline:
@@ -141,10 +168,30 @@ class SignLanguagePipeline:
             vocabulary=self.vocabulary
         )
         
+        # Memoized label -> (is_word_level, semantic_meaning) lookup, keyed
+        # on the vocabulary version so custom words take effect immediately
+        self._resolve_label = lru_cache(maxsize=512)(self._resolve_label_impl)
+        
+        # Memoized text-to-sign results, keyed on TextToSignTranslator.cache_key
+        # (normalized text plus vocabulary version and settings)
+        self._translate_cached = lru_cache(maxsize=256)(self._translate_impl)
+        
         # State
         self._state = PipelineState()
         self._frame_id = 0
         
+        # Reusable frame objects for process_frame (the aggregator copies
+        # what it keeps, so frames never outlive a single call)
+        self._frame_pool = [
+            GestureFrame(timestamp=0.0, frame_id=0)
+            for _ in range(self.config.aggregation_window * 2)
+        ]
+        self._frame_pool_idx = 0
+        
+        # Persistent input buffers callers can fill in place each frame
+        self._landmark_buf = np.empty(LANDMARK_SHAPE, dtype=np.float32)
+        self._features_buf = np.empty((self.config.feature_dim,), dtype=np.float32)
+        
         # Callbacks
         self._on_gesture_recognized: Optional[Callable[[RecognizedGesture], None]] = None
         self._on_text_updated: Optional[Callable[[str, str], None]] = None
@@ -156,6 +203,21 @@ class SignLanguagePipeline:
         
         # Auto-translate timer tracking
         self._last_gesture_time = 0.0
+        self._is_accumulate_mode = False  # LIVE_ACCUMULATE with auto-translate on
+        
+        # Set when the sentence builder already pushed fresh text into state
+        self._text_updated_this_tick = False
+        
+        # Latest (text, preview) not yet sent to _on_text_updated; flushed
+        # once at the end of each processing call
+        self._pending_text_update: Optional[Tuple[str, str]] = None
+        
+        # Async mode workers (see _start_workers)
+        self._q_in: Optional[Queue] = None
+        self._q_agg: Optional[Queue] = None
+        self._callback_queue: deque = deque()  # append/popleft are atomic
+        self._workers: List[threading.Thread] = []
+        self._builder_lock = threading.RLock()
     
     def _setup_callbacks(self):
         """Setup internal component callbacks."""
@@ -174,16 +236,27 @@ class SignLanguagePipeline:
         Args:
             mode: Operating mode for the pipeline
         """
+        self._stop_workers()
         self.clear()
         
         self._state.mode = mode
         self._state.is_processing = True
-        self._state.start_time = time.time()
+        self._state.start_time = time.monotonic()
+        self._is_accumulate_mode = (
+            mode is PipelineMode.LIVE_ACCUMULATE and self.config.auto_translate_enabled
+        )
+        
+        if self.config.async_mode and mode in (
+            PipelineMode.LIVE_CONTINUOUS, PipelineMode.LIVE_ACCUMULATE
+        ):
+            self._start_workers()
         
         self._notify_state_change()
     
     def stop(self):
         """Stop the pipeline without translating."""
+        self._stop_workers()
+        self._is_accumulate_mode = False
         self._state.is_processing = False
         self._state.mode = PipelineMode.IDLE
         self._notify_state_change()
@@ -194,20 +267,38 @@ class SignLanguagePipeline:
         Returns:
             TranslationResult with complete translation
         """
+        # Drain worker queues first so no frame is lost
+        self._stop_workers()
+        
         # Force finalize any pending gesture
         self.aggregator.force_finalize()
         
         # Get final translation
         result = self.sentence_builder.finalize()
+        self._flush_text_update()
         
         # Stop
+        self._is_accumulate_mode = False
         self._state.is_processing = False
         self._state.mode = PipelineMode.IDLE
         
+        self.dispatch_callbacks()
         self._notify_state_change()
         
         return result
     
+    def get_landmark_buffer(self) -> np.ndarray:
+        """Get the persistent (21, 3) float32 landmark input buffer.
+        
+        Fill it in place and pass it to process_frame to avoid
+        allocating a new array per frame.
+        """
+        return self._landmark_buf
+    
+    def get_features_buffer(self) -> np.ndarray:
+        """Get the persistent float32 feature input buffer."""
+        return self._features_buf
+    
     def process_frame(
         self,
         landmarks: Optional[np.ndarray],
@@ -219,34 +310,38 @@ class SignLanguagePipeline:
     ) -> Optional[str]:
         """Process a single frame through the pipeline.
         
+        The arrays passed in may alias the buffers returned by
+        get_landmark_buffer()/get_features_buffer(); they are only read
+        during this call (the aggregator copies what it keeps).
+        
         Args:
             landmarks: Hand landmarks (21 x 3 array)
             features: Extracted features for classification
             predicted_label: ML model prediction (if available)
             confidence: Prediction confidence
             gesture_type: Type of gesture detected
-            timestamp: Frame timestamp (uses current time if None)
+            timestamp: Frame timestamp (uses time.monotonic() if None)
             
         Returns:
-            Updated text if changed, None otherwise
+            Updated text if changed, None otherwise (always None in
+            async mode; use the text callback instead)
         """
         if not self._state.is_processing:
             return None
         
+        if self._q_in is not None:
+            return self._submit_frame(
+                landmarks, features, predicted_label,
+                confidence, gesture_type, timestamp
+            )
+        
         self._frame_id += 1
-        current_time = timestamp or time.time()
+        # One clock read per frame, shared by every stage below
+        current_time = timestamp if timestamp is not None else time.monotonic()
         
-        # Create frame object
-        frame = GestureFrame(
-            timestamp=current_time,
-            frame_id=self._frame_id,
-            landmarks=landmarks,
-            features=features,
-            predicted_label=predicted_label,
-            confidence=confidence,
-            gesture_type=gesture_type,
-            hand_detected=landmarks is not None
-        )
+        # Interned labels compare by identity against vocabulary keys
+        if predicted_label:
+            predicted_label = sys.intern(str(predicted_label))
         
         # Update state
         self._state.frames_processed = self._frame_id
@@ -256,21 +351,128 @@ class SignLanguagePipeline:
             self._state.last_gesture = predicted_label
             self._state.last_confidence = confidence
         
-        # Process through aggregator
-        recognized = self.aggregator.process_frame(frame)
+        if landmarks is None and (not predicted_label or confidence < self.config.min_confidence):
+            # Nothing to vote on: only the aggregator's no-hand tracking
+            # needs to advance, so skip filling a frame object
+            recognized = self.aggregator.process_empty_frame(gesture_type, confidence)
+        else:
+            recognized = self.aggregator.process_frame(
+                self._fill_frame(
+                    current_time, landmarks, features,
+                    predicted_label, confidence, gesture_type
+                ),
+                current_time
+            )
         
         # Check for auto-translate timeout
-        if self.config.auto_translate_enabled and self._state.mode == PipelineMode.LIVE_ACCUMULATE:
-            self._check_auto_translate()
+        if self._is_accumulate_mode:
+            self._check_auto_translate(current_time)
+        
+        if self._pending_text_update is not None:
+            self._flush_text_update()
         
         # Return current text
         return self._state.current_text if recognized else None
     
+    def process_batch(
+        self,
+        landmarks: Optional[np.ndarray],
+        labels: List[Optional[str]],
+        confidences: np.ndarray,
+        types: Optional[List[GestureType]] = None,
+        timestamps: Optional[np.ndarray] = None
+    ) -> List[Optional[str]]:
+        """Process many frames at once (e.g. a fully decoded video file).
+        
+        Frame filtering is done with NumPy up front; only the per-frame
+        aggregator step runs in the Python loop, and pipeline state is
+        updated once for the whole batch.
+        
+        Args:
+            landmarks: (N, 21, 3) landmarks; all-NaN rows (or None for the
+                whole batch) mark frames without a detected hand
+            labels: Per-frame predicted labels (None/"" if no prediction)
+            confidences: (N,) prediction confidences
+            types: Per-frame gesture types (STATIC if None)
+            timestamps: (N,) frame timestamps (spaced at target_fps if None)
+            
+        Returns:
+            Per-frame results, as process_frame() would return them
+        """
+        n = len(labels)
+        results: List[Optional[str]] = [None] * n
+        if not self._state.is_processing or n == 0:
+            return results
+        
+        confidences = np.asarray(confidences, dtype=np.float32)
+        if timestamps is None:
+            timestamps = time.monotonic() + np.arange(n) / self.config.target_fps
+        if types is None:
+            types = [GestureType.STATIC] * n
+        labels = [sys.intern(str(label)) if label else label for label in labels]
+        
+        if self._q_in is not None:
+            # Async mode already decouples the stages; just enqueue
+            for i in range(n):
+                self.process_frame(
+                    None if landmarks is None else landmarks[i], None,
+                    labels[i], float(confidences[i]), types[i], float(timestamps[i])
+                )
+            return results
+        
+        # Vectorized classification of the whole batch
+        has_label = np.fromiter(map(bool, labels), dtype=bool, count=n)
+        usable = has_label & (confidences >= self.config.min_confidence)
+        if landmarks is None:
+            has_hand = np.zeros(n, dtype=bool)
+        else:
+            landmarks = np.asarray(landmarks, dtype=np.float32)
+            has_hand = ~np.isnan(landmarks.reshape(n, -1)).all(axis=1)
+        empty = (~has_hand & ~usable).tolist()
+        has_hand = has_hand.tolist()
+        conf_list = confidences.tolist()
+        time_list = np.asarray(timestamps, dtype=np.float64).tolist()
+        
+        aggregator = self.aggregator
+        check_timeout = self._is_accumulate_mode
+        for i in range(n):
+            self._frame_id += 1
+            now = time_list[i]
+            if empty[i]:
+                recognized = aggregator.process_empty_frame(types[i], conf_list[i])
+            else:
+                recognized = aggregator.process_frame(
+                    self._fill_frame(
+                        now, landmarks[i] if has_hand[i] else None, None,
+                        labels[i], conf_list[i], types[i]
+                    ),
+                    now
+                )
+            if check_timeout:
+                self._check_auto_translate(now)
+            if recognized:
+                results[i] = self._state.current_text
+        
+        # Update state once for the batch
+        self._state.frames_processed = self._frame_id
+        self._state.last_update_time = time_list[-1]
+        labeled = np.flatnonzero(has_label & (confidences > 0))
+        if labeled.size:
+            last = int(labeled[-1])
+            self._state.last_gesture = labels[last]
+            self._state.last_confidence = conf_list[last]
+        
+        if self._pending_text_update is not None:
+            self._flush_text_update()
+        
+        return results
+    
     def process_gesture(
         self,
         label: str,
         confidence: float,
-        gesture_type: GestureType = GestureType.STATIC
+        gesture_type: GestureType = GestureType.STATIC,
+        timestamp: Optional[float] = None
     ) -> Optional[str]:
         """Process a pre-recognized gesture (skip aggregation).
         
@@ -281,6 +483,8 @@ class SignLanguagePipeline:
             label: Gesture label
             confidence: Recognition confidence
             gesture_type: Type of gesture
+            timestamp: Gesture timestamp, on the same clock as frame
+                timestamps (uses time.monotonic() if None)
             
         Returns:
             Updated text if changed
@@ -291,8 +495,12 @@ class SignLanguagePipeline:
         if confidence < self.config.min_confidence:
             return None
         
+        label = sys.intern(str(label))
+        
         # Create recognized gesture directly
-        current_time = time.time()
+        current_time = timestamp if timestamp is not None else time.monotonic()
+        
+        is_word, meaning = self._resolve_label(label, self.vocabulary.version)
         
         gesture = RecognizedGesture(
             label=label,
@@ -301,30 +509,40 @@ class SignLanguagePipeline:
             start_time=current_time,
             end_time=current_time,
             frame_count=1,
-            is_word_level=self.vocabulary.is_word_gesture(label)
+            is_word_level=is_word
         )
         
         # Set semantic meaning if word-level
-        if gesture.is_word_level:
-            sign = self.vocabulary.get_sign_by_gesture(label)
-            if sign:
-                gesture.semantic_meaning = sign.text
+        if meaning:
+            gesture.semantic_meaning = meaning
         
         # Process through sentence builder
-        self._handle_recognized_gesture(gesture)
+        with self._builder_lock:
+            self._handle_recognized_gesture(gesture)
+            
+            if self._pending_text_update is not None:
+                self._flush_text_update()
         
         return self._state.current_text
     
     def translate_text_to_sign(self, text: str) -> SignSequenceResult:
         """Translate text to sign language representation.
         
+        Results are cached per normalized text and their sign lists are
+        shared between calls, so treat the returned object as read-only.
+        
         Args:
             text: Text to translate
             
         Returns:
             SignSequenceResult with sign sequence for display
         """
-        return self.text_to_sign.translate(text)
+        if not text:
+            return SignSequenceResult(original_text=text)
+        result = self._translate_cached(self.text_to_sign.cache_key(text))
+        if result.original_text != text:
+            result = replace(result, original_text=text)
+        return result
     
     def get_current_text(self) -> str:
         """Get current accumulated text."""
@@ -357,14 +575,19 @@ class SignLanguagePipeline:
         self.aggregator.clear()
         self.sentence_builder.clear()
         
-        self._state = PipelineState()
+        # Reset in place so holders of get_state() keep a live reference
+        self._state.reset()
         self._frame_id = 0
         self._last_gesture_time = 0.0
+        self._pending_text_update = None
+        self._resolve_label.cache_clear()
+        self._translate_cached.cache_clear()
     
     def insert_space(self):
         """Manually insert a word boundary."""
-        self.sentence_builder.constructor.insert_space()
-        self._update_state_text()
+        with self._builder_lock:
+            self.sentence_builder.constructor.insert_space()
+            self._update_state_text()
     
     def delete_last(self, delete_word: bool = False):
         """Delete last letter or word.
@@ -372,14 +595,32 @@ class SignLanguagePipeline:
         Args:
             delete_word: If True, delete whole word; else delete letter
         """
-        if delete_word:
-            self.sentence_builder.constructor.remove_last_word()
-        else:
-            self.sentence_builder.constructor.remove_last_letter()
-        self._update_state_text()
+        with self._builder_lock:
+            if delete_word:
+                self.sentence_builder.constructor.remove_last_word()
+            else:
+                self.sentence_builder.constructor.remove_last_letter()
+            self._update_state_text()
     
     # === Callbacks ===
     
+    def dispatch_callbacks(self) -> int:
+        """Run external callbacks queued by async mode workers.
+        
+        In async mode, callbacks are marshalled here instead of running on
+        worker threads; call this from the GUI/main thread (e.g. a timer).
+        
+        Returns:
+            Number of callbacks dispatched
+        """
+        pending = self._callback_queue
+        count = 0
+        while pending:
+            callback, args = pending.popleft()
+            callback(*args)
+            count += 1
+        return count
+    
     def set_on_gesture_recognized(self, callback: Callable[[RecognizedGesture], None]):
         """Set callback for gesture recognition events."""
         self._on_gesture_recognized = callback
@@ -400,54 +641,241 @@ class SignLanguagePipeline:
     
     def _handle_recognized_gesture(self, gesture: RecognizedGesture):
         """Handle a recognized gesture from aggregator."""
+        self._text_updated_this_tick = False
         self._state.gestures_recognized += 1
-        self._last_gesture_time = time.time()
+        # Stay on the clock of the frame that produced the gesture; the
+        # sentence builder gets the same time so its timeouts agree
+        now = gesture.end_time
+        self._last_gesture_time = now
         
         # Check if it's a word-level gesture
-        if self.vocabulary.is_word_gesture(gesture.label):
+        is_word, meaning = self._resolve_label(gesture.label, self.vocabulary.version)
+        if is_word:
             gesture.is_word_level = True
-            sign = self.vocabulary.get_sign_by_gesture(gesture.label)
-            if sign:
-                gesture.semantic_meaning = sign.text
+            gesture.semantic_meaning = meaning
         
         # Add to sentence builder
-        self.sentence_builder.add_gesture(gesture)
+        self.sentence_builder.add_gesture(gesture, now)
         
         # External callback
         if self._on_gesture_recognized:
-            self._on_gesture_recognized(gesture)
+            self._emit(self._on_gesture_recognized, gesture)
+        
+        # Builder callback already wrote current_text/current_preview
+        if not self._text_updated_this_tick:
+            self._update_state_text()
+    
+    def _fill_frame(
+        self,
+        current_time: float,
+        landmarks: Optional[np.ndarray],
+        features: Optional[np.ndarray],
+        predicted_label: Optional[str],
+        confidence: float,
+        gesture_type: GestureType
+    ) -> GestureFrame:
+        """Fill the next pooled frame object in place and return it."""
+        frame = self._frame_pool[self._frame_pool_idx]
+        self._frame_pool_idx = (self._frame_pool_idx + 1) % len(self._frame_pool)
+        frame.timestamp = current_time
+        frame.frame_id = self._frame_id
+        # Hand shared buffers downstream as views so the frame never
+        # exposes the caller-owned buffer object itself
+        if landmarks is self._landmark_buf:
+            landmarks = landmarks.view()
+        if features is self._features_buf:
+            features = features.view()
+        frame.landmarks = landmarks
+        frame.features = features
+        frame.predicted_label = predicted_label
+        frame.confidence = confidence
+        frame.gesture_type = gesture_type
+        frame.hand_detected = landmarks is not None
+        frame.metadata.clear()
+        return frame
+    
+    def _translate_impl(self, key: tuple) -> SignSequenceResult:
+        """Translate the normalized text at the head of a cache key."""
+        return self.text_to_sign.translate_normalized(key[0])
+    
+    def _resolve_label_impl(self, label: str, version: int) -> Tuple[bool, Optional[str]]:
+        """Resolve a gesture label with a single vocabulary lookup.
         
-        self._update_state_text()
+        Args:
+            label: Gesture label
+            version: Vocabulary version (only part of the cache key)
+            
+        Returns:
+            (is_word_level, semantic_meaning or None)
+        """
+        sign = self.vocabulary.get_sign_by_gesture(label)
+        if sign and sign.category in WORDLIKE_CATEGORIES:
+            return True, sign.text
+        return False, None
     
     def _handle_text_updated(self, text: str, preview: str):
         """Handle text update from sentence builder."""
+        self._text_updated_this_tick = True
         self._state.current_text = text
         self._state.current_preview = preview
         
+        # Coalesced: only the last update of a processing call is sent
+        self._pending_text_update = (text, preview)
+    
+    def _flush_text_update(self):
+        """Send the pending text update (if any) to the external callback."""
+        pending = self._pending_text_update
+        if pending is None:
+            return
+        self._pending_text_update = None
         if self._on_text_updated:
-            self._on_text_updated(text, preview)
+            self._emit(self._on_text_updated, *pending)
     
     def _handle_sentence_complete(self, result: TranslationResult):
         """Handle sentence completion."""
         if self._on_translation_complete:
-            self._on_translation_complete(result)
+            self._emit(self._on_translation_complete, result)
     
-    def _check_auto_translate(self):
-        """Check and trigger auto-translate if needed."""
+    def _check_auto_translate(self, now: float):
+        """Check and trigger auto-translate if needed.
+        
+        Args:
+            now: Timestamp of the frame being processed
+        """
         if self._last_gesture_time == 0:
             return
         
-        elapsed = time.time() - self._last_gesture_time
+        elapsed = now - self._last_gesture_time
         
         if elapsed >= self.config.sentence_timeout:
             # Check timeouts
-            self.sentence_builder.check_timeouts()
+            self.sentence_builder.check_timeouts(now)
     
     def _update_state_text(self):
         """Update state with current text."""
         self._state.current_text = self.sentence_builder.get_current_text()
         self._state.current_preview = self.sentence_builder.get_preview()
     
+    def _emit(self, callback: Callable, *args):
+        """Invoke an external callback, deferring it when workers are running."""
+        if self._workers:
+            self._callback_queue.append((callback, args))
+        else:
+            callback(*args)
+    
+    # === Async mode ===
+    
+    def _start_workers(self):
+        """Spawn the aggregator and sentence builder threads."""
+        size = self.config.async_queue_size
+        self._q_in = Queue(maxsize=size)
+        self._q_agg = Queue(maxsize=size)
+        
+        # Aggregator results go to the sentence thread instead of inline
+        self.aggregator.set_on_gesture_recognized(self._enqueue_recognized)
+        
+        self._workers = [
+            threading.Thread(target=self._agg_worker, name="pipeline-aggregator", daemon=True),
+            threading.Thread(target=self._sent_worker, name="pipeline-sentence", daemon=True),
+        ]
+        for worker in self._workers:
+            worker.start()
+    
+    def _stop_workers(self):
+        """Drain the queues and join worker threads (no-op in sync mode)."""
+        if self._q_in is None:
+            return
+        
+        q_in, self._q_in = self._q_in, None
+        q_in.put(None)  # Sentinel; blocks until there is room
+        for worker in self._workers:
+            worker.join()
+        
+        self._workers = []
+        self._q_agg = None
+        self.aggregator.set_on_gesture_recognized(self._handle_recognized_gesture)
+    
+    def _submit_frame(
+        self,
+        landmarks: Optional[np.ndarray],
+        features: Optional[np.ndarray],
+        predicted_label: Optional[str],
+        confidence: float,
+        gesture_type: GestureType,
+        timestamp: Optional[float]
+    ) -> None:
+        """Queue a frame for the aggregator thread.
+        
+        Blocks while the queue is full, so a producer that outpaces the
+        aggregator is slowed down instead of losing frames (votes and
+        gesture timing depend on seeing every frame).
+        """
+        self._frame_id += 1
+        current_time = timestamp if timestamp is not None else time.monotonic()
+        
+        # Inputs may be caller-reused buffers, so the worker gets copies
+        frame = GestureFrame(
+            timestamp=current_time,
+            frame_id=self._frame_id,
+            landmarks=None if landmarks is None else np.array(landmarks),
+            features=None if features is None else np.array(features),
+            predicted_label=predicted_label,
+            confidence=confidence,
+            gesture_type=gesture_type,
+            hand_detected=landmarks is not None
+        )
+        
+        self._state.frames_processed = self._frame_id
+        self._state.last_update_time = current_time
+        if predicted_label and confidence > 0:
+            self._state.last_gesture = predicted_label
+            self._state.last_confidence = confidence
+        
+        q_in = self._q_in
+        while True:
+            try:
+                q_in.put(frame, timeout=_SUBMIT_POLL_INTERVAL)
+                return None
+            except Full:
+                # Workers stopped while we waited: nothing will drain the queue
+                if self._q_in is not q_in:
+                    return None
+    
+    def _enqueue_recognized(self, gesture: RecognizedGesture):
+        """Aggregator callback in async mode: hand off to the sentence thread."""
+        self._q_agg.put((gesture, gesture.end_time))
+    
+    def _agg_worker(self):
+        """Aggregator thread: frames in, recognized gestures out."""
+        q_in, q_agg = self._q_in, self._q_agg
+        while True:
+            frame = q_in.get()
+            if frame is None:
+                q_agg.put(None)
+                return
+            
+            self.aggregator.process_frame(frame, frame.timestamp)
+            
+            # Let the sentence thread run the auto-translate check
+            if self._is_accumulate_mode:
+                q_agg.put((None, frame.timestamp))
+    
+    def _sent_worker(self):
+        """Sentence builder thread: consumes recognized gestures."""
+        q_agg = self._q_agg
+        while True:
+            item = q_agg.get()
+            if item is None:
+                return
+            
+            gesture, now = item
+            with self._builder_lock:
+                if gesture is not None:
+                    self._handle_recognized_gesture(gesture)
+                else:
+                    self._check_auto_translate(now)
+                self._flush_text_update()
+    
     def _notify_state_change(self):
         """Notify state change callback."""
         if self._on_state_changed:
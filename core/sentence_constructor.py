@@ -10,11 +10,18 @@ into coherent, readable text:
 - Word pattern recognition
 """
 import re
+import sys
 import time
-from typing import Optional, List, Tuple, Dict, Set
+from functools import lru_cache
+from typing import Optional, List, Tuple, Dict, Set, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from .gesture_sequence import (
     RecognizedGesture, GestureSequence, GestureType,
     TranslationResult
@@ -22,6 +29,131 @@ from .gesture_sequence import (
 from .sign_vocabulary import SignVocabulary, SignCategory
 
 
+# Word boundary markers
+_WORD_DELIMITERS = frozenset({'WAVE', 'SPACE', ' ', '_', 'PAUSE'})
+
+# Single-character ASCII letters/digits (the common gesture labels)
+_ASCII_ALNUM = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+
+
+def _group_by_length(mapping: Dict[str, str]) -> Dict[int, Dict[str, str]]:
+    """Split a string-keyed mapping into sub-mappings by key length."""
+    grouped: Dict[int, Dict[str, str]] = {}
+    for key, value in mapping.items():
+        grouped.setdefault(len(key), {})[key] = value
+    return grouped
+
+
+@lru_cache(maxsize=256)
+def _upper_label(label: str) -> str:
+    """Uppercase a gesture label once per distinct label (interned)."""
+    return sys.intern(str(label).upper())
+
+
+def _build_automaton(keys) -> Optional[Any]:
+    """Build an Aho-Corasick automaton over uppercase keys (if available).
+    
+    Each key maps to (key_length, key_index).
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, key in enumerate(keys):
+        automaton.add_word(key, (len(key), index))
+    automaton.make_automaton()
+    return automaton
+
+
+def _make_formatter(
+    i_re: "re.Pattern",
+    contraction_re: "re.Pattern",
+    replacements: Tuple[str, ...],
+    automaton: Optional[Any]
+) -> Callable[[str], str]:
+    """Build a text formatter specialized to a fixed rule set.
+    
+    The compiled patterns, their bound methods and the replacement table
+    are closure constants, so a call does no attribute or dict lookups to
+    reach them.
+    
+    Args:
+        i_re: Pattern matching a standalone lowercase "i"
+        contraction_re: Alternation with one group per contraction
+        replacements: Replacement for each contraction group, in order
+        automaton: Aho-Corasick automaton over the uppercase contraction
+            keys (see _build_automaton), or None to always use the regex
+    """
+    i_sub = i_re.sub
+    contraction_sub = contraction_re.sub
+    iter_matches = automaton.iter if automaton is not None else None
+    
+    def replace(match: "re.Match") -> str:
+        return replacements[match.lastindex - 1]
+    
+    def format_text(text: str) -> str:
+        """Apply formatting and basic grammar normalization.
+        
+        Args:
+            text: Raw text
+            
+        Returns:
+            Formatted text
+        """
+        if not text:
+            return ""
+        
+        # Normalize whitespace; text we built ourselves is already single
+        # spaced. isprintable() is False for every whitespace but " ", so
+        # this check is exact.
+        if not text.isprintable() or "  " in text or text[0] == " " or text[-1] == " ":
+            text = " ".join(text.split())
+        
+        # Capitalize first letter
+        if text:
+            text = text[0].upper() + text[1:]
+        
+        # Capitalize "I" when standalone (gesture letters are uppercase, so
+        # there is usually no lowercase "i" to look at)
+        if 'i' in text:
+            text = i_sub('I', text)
+        
+        # Common contractions; .upper() keeps automaton indices aligned
+        # with the text only for ASCII
+        if iter_matches is None or not text.isascii():
+            return contraction_sub(replace, text)
+        
+        upper = text.upper()
+        size = len(upper)
+        matches = []
+        for end, (length, index) in iter_matches(upper):
+            start = end - length + 1
+            # Same word boundaries as the regex's \b
+            if start > 0 and (upper[start - 1].isalnum() or upper[start - 1] == '_'):
+                continue
+            if end + 1 < size and (upper[end + 1].isalnum() or upper[end + 1] == '_'):
+                continue
+            matches.append((start, index, end))
+        
+        if not matches:
+            return text
+        
+        # The automaton reports matches by end position; the regex takes the
+        # leftmost match and, at one position, the first alternative
+        matches.sort()
+        pieces = []
+        last = 0
+        for start, index, end in matches:
+            if start < last:
+                continue
+            pieces.append(text[last:start])
+            pieces.append(replacements[index])
+            last = end + 1
+        pieces.append(text[last:])
+        return "".join(pieces)
+    
+    return format_text
+
+
 class ConstructionMode(Enum):
     """Modes for sentence construction."""
     LETTER_BY_LETTER = "letter"    # Pure letter spelling
@@ -32,13 +164,45 @@ class ConstructionMode(Enum):
 
 @dataclass
 class WordCandidate:
-    """A potential word being built from letters."""
+    """A potential word being built from letters.
+    
+    Use append()/pop_letter()/set_letters() rather than mutating
+    `letters` directly, so the cached text stays in sync.
+    """
     letters: List[str] = field(default_factory=list)
     start_time: float = 0.0
     confidences: List[float] = field(default_factory=list)
+    _text: str = field(default="", init=False, repr=False, compare=False)
+    _conf_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._text = "".join(self.letters)
+        self._conf_sum = sum(self.confidences)
+    
+    def append(self, letter: str, confidence: float):
+        """Add a letter and its confidence."""
+        self.letters.append(letter)
+        self.confidences.append(confidence)
+        self._text += letter
+        self._conf_sum += confidence
+    
+    def pop_letter(self) -> str:
+        """Remove and return the last letter (and its confidence)."""
+        letter = self.letters.pop()
+        if self.confidences:
+            self.confidences.pop()
+            # Re-sum (rare path) rather than subtract, to avoid float drift
+            self._conf_sum = sum(self.confidences)
+        self._text = self._text[:len(self._text) - len(letter)]
+        return letter
+    
+    def set_letters(self, letters: List[str]):
+        """Replace the letters (confidences are left untouched)."""
+        self.letters = letters
+        self._text = "".join(letters)
     
     def get_text(self) -> str:
-        return "".join(self.letters)
+        return self._text
     
     @property
     def length(self) -> int:
@@ -48,7 +212,7 @@ class WordCandidate:
     def average_confidence(self) -> float:
         if not self.confidences:
             return 0.0
-        return sum(self.confidences) / len(self.confidences)
+        return self._conf_sum / len(self.confidences)
 
 
 class SentenceConstructor:
@@ -62,6 +226,56 @@ class SentenceConstructor:
     - Basic grammar normalization
     """
     
+    # Common abbreviations to expand (shared by all instances)
+    _ABBREVIATIONS: Dict[str, str] = {
+        'TY': 'Thank you',
+        'TYS': 'Thank you so much',
+        'NP': 'No problem',
+        'PLZ': 'Please',
+        'PLS': 'Please',
+        'ILY': 'I love you',
+        'OMG': 'Oh my god',
+        'BTW': 'By the way',
+        'IDK': "I don't know",
+        'NVM': 'Never mind',
+    }
+    
+    # Same table bucketed by length: most words can't be abbreviations
+    _ABBREV_BY_LEN: Dict[int, Dict[str, str]] = _group_by_length(_ABBREVIATIONS)
+    
+    # Common contractions (matched case-insensitively on whole words)
+    _CONTRACTION_MAP: Dict[str, str] = {
+        'I M': "I'm",
+        'DONT': "don't",
+        'WONT': "won't",
+        'CANT': "can't",
+        'YOURE': "you're",
+        'THEYRE': "they're",
+        'WERE': "we're",
+        'ILL': "I'll",
+        'YOULL': "you'll",
+    }
+    
+    # One alternation pass instead of a re.sub per contraction; each
+    # alternative is its own group, so m.lastindex picks the replacement
+    # (an .upper() key lookup would miss Unicode case-insensitive matches)
+    _CONTRACTION_RE = re.compile(
+        r'\b(?:' + '|'.join('(' + re.escape(k) + ')' for k in _CONTRACTION_MAP) + r')\b',
+        re.IGNORECASE
+    )
+    _CONTRACTION_REPLACEMENTS: Tuple[str, ...] = tuple(_CONTRACTION_MAP.values())
+    
+    # Linear-time scanner for the same rules (None without pyahocorasick)
+    _CONTRACTION_AC = _build_automaton(_CONTRACTION_MAP)
+    
+    # Standalone lowercase "i"
+    _I_RE = re.compile(r'\bi\b')
+    
+    # Formatter specialized to the rules above
+    _format_text = staticmethod(_make_formatter(
+        _I_RE, _CONTRACTION_RE, _CONTRACTION_REPLACEMENTS, _CONTRACTION_AC
+    ))
+    
     def __init__(
         self,
         vocabulary: Optional[SignVocabulary] = None,
@@ -85,81 +299,85 @@ class SentenceConstructor:
         # Current state
         self._current_word = WordCandidate()
         self._words: List[str] = []
+        self._joined_words: str = ""  # " ".join(self._words), kept incrementally
+        self._joined_dirty: bool = False  # Set by _pop_word; rejoined on demand
         self._gesture_sequence = GestureSequence()
         
         # Timing
         self._last_gesture_time: float = 0.0
         self._sentence_start_time: float = 0.0
         
-        # Accumulated text
+        # Accumulated text (formatting is deferred until the text is read)
         self._raw_text: str = ""
         self._formatted_text: str = ""
+        self._formatted_dirty: bool = False
         
-        # Word boundary markers
-        self._word_delimiters = {'WAVE', 'SPACE', ' ', '_', 'PAUSE'}
-        
-        # Common abbreviations to expand
-        self._abbreviations = {
-            'TY': 'Thank you',
-            'TYS': 'Thank you so much',
-            'NP': 'No problem',
-            'PLZ': 'Please',
-            'PLS': 'Please',
-            'ILY': 'I love you',
-            'OMG': 'Oh my god',
-            'BTW': 'By the way',
-            'IDK': "I don't know",
-            'NVM': 'Never mind',
-        }
-    
-    def add_gesture(self, gesture: RecognizedGesture) -> Optional[str]:
+        # Cached preview and the (joined words, partial word) strings it was
+        # built from; strings are immutable, so identity means unchanged
+        self._preview: str = ""
+        self._preview_key: Optional[Tuple[str, str]] = None
+    
+    def add_gesture(
+        self,
+        gesture: RecognizedGesture,
+        format_text: bool = True,
+        now: Optional[float] = None
+    ) -> Optional[str]:
         """Add a recognized gesture to the sentence.
         
         Args:
             gesture: The recognized gesture
+            format_text: If False, skip formatting and return None
+                (formatting then happens on the next read)
+            now: Time of the gesture (uses time.monotonic() if None);
+                check_timeout must then be given the same clock
             
         Returns:
             Updated text if changed, None otherwise
         """
-        current_time = time.time()
+        current_time = time.monotonic() if now is None else now
+        label = gesture.label
         
         # Record in sequence
         self._gesture_sequence.add_gesture(gesture)
         
         # Check for timeout (word boundary)
-        if self._last_gesture_time > 0:
-            elapsed = current_time - self._last_gesture_time
-            if elapsed > self.word_timeout:
-                self._finalize_word()
+        last_time = self._last_gesture_time
+        if last_time > 0 and current_time - last_time > self.word_timeout:
+            self._finalize_word(current_time)
         
         self._last_gesture_time = current_time
         
         if self._sentence_start_time == 0:
             self._sentence_start_time = current_time
         
+        label_upper = _upper_label(label)
+        
         # Process gesture based on type
-        if gesture.is_word_level or self.vocabulary.is_word_gesture(gesture.label):
+        if gesture.is_word_level or self.vocabulary.is_word_gesture(label):
             # Word-level gesture - insert as word
-            self._finalize_word()  # Finalize any pending letters
+            self._finalize_word(current_time)  # Finalize any pending letters
             word_text = self._get_word_text(gesture)
-            self._words.append(word_text)
+            self._append_word(word_text)
             
-        elif gesture.label.upper() in self._word_delimiters:
+        elif label_upper in _WORD_DELIMITERS:
             # Space/delimiter gesture
-            self._finalize_word()
+            self._finalize_word(current_time)
             
-        elif self._is_letter_or_number(gesture.label):
+        elif self._is_letter_or_number(label):
             # Letter or number - add to current word
-            self._current_word.letters.append(gesture.label.upper())
-            self._current_word.confidences.append(gesture.confidence)
+            self._current_word.append(label_upper, gesture.confidence)
         
         # Update text
         self._update_text()
         
-        return self._formatted_text
+        return self._formatted() if format_text else None
     
     def _is_letter_or_number(self, label: str) -> bool:
         """Check if label is a single letter or number."""
+        # One hash probe for ASCII; Unicode category checks only otherwise
+        if label in _ASCII_ALNUM:
+            return True
         return len(label) == 1 and (label.isalpha() or label.isdigit())
     
     def _get_word_text(self, gesture: RecognizedGesture) -> str:
@@ -173,8 +391,12 @@ class SentenceConstructor:
         
         return gesture.label
     
-    def _finalize_word(self):
-        """Finalize current word and add to words list."""
+    def _finalize_word(self, now: Optional[float] = None):
+        """Finalize current word and add to words list.
+        
+        Args:
+            now: Current time already read by the caller, if any
+        """
         if self._current_word.length == 0:
             return
         
@@ -187,72 +409,65 @@ class SentenceConstructor:
                 word_text = recognized
             else:
                 # Check abbreviations
-                abbrev = self._abbreviations.get(word_text.upper())
-                if abbrev:
-                    word_text = abbrev
+                upper = word_text.upper()
+                bucket = self._ABBREV_BY_LEN.get(len(upper))
+                if bucket:
+                    abbrev = bucket.get(upper)
+                    if abbrev:
+                        word_text = abbrev
         
         if word_text:
-            self._words.append(word_text)
+            self._append_word(word_text)
         
         # Reset current word
-        self._current_word = WordCandidate(start_time=time.time())
+        self._current_word = WordCandidate(
+            start_time=now if now is not None else time.monotonic()
+        )
+    
+    def _append_word(self, word: str):
+        """Append a finalized word, extending the joined text in place."""
+        if not self._joined_dirty:
+            self._joined_words = f"{self._joined_words} {word}" if self._words else word
+        self._words.append(word)
+    
+    def _pop_word(self) -> str:
+        """Remove and return the last word (the join is redone lazily)."""
+        self._joined_dirty = True
+        return self._words.pop()
+    
+    def _get_joined_words(self) -> str:
+        """Get " ".join(self._words), rejoining only after a pop."""
+        if self._joined_dirty:
+            self._joined_words = " ".join(self._words)
+            self._joined_dirty = False
+        return self._joined_words
     
     def _update_text(self):
         """Update raw and formatted text from words."""
-        # Build raw text from words and current partial word
-        parts = self._words.copy()
-        
-        # Add current word in progress (if any)
+        # Build raw text from joined words and current partial word
+        raw = self._get_joined_words()
         if self._current_word.length > 0:
-            parts.append(self._current_word.get_text())
-        
-        self._raw_text = " ".join(parts)
-        
-        # Format text
-        self._formatted_text = self._format_text(self._raw_text)
+            partial = self._current_word.get_text()
+            raw = f"{raw} {partial}" if self._words else partial
+        
+        # Mark for reformatting only when the raw text actually changed
+        if raw != self._raw_text:
+            self._raw_text = raw
+            self._formatted_dirty = True
+    
+    def _formatted(self) -> str:
+        """Get formatted text, running the formatter only if stale."""
+        if self._formatted_dirty:
+            self._formatted_text = self._format_text(self._raw_text)
+            self._formatted_dirty = False
+        return self._formatted_text
     
-    def _format_text(self, text: str) -> str:
-        """Apply formatting and basic grammar normalization.
+    def check_timeout(self, now: Optional[float] = None) -> Tuple[bool, bool]:
+        """Check for word and sentence timeouts.
         
         Args:
-            text: Raw text
-            
-        Returns:
-            Formatted text
-        """
-        if not text:
-            return ""
-        
-        # Normalize whitespace
-        text = " ".join(text.split())
-        
-        # Capitalize first letter
-        if text:
-            text = text[0].upper() + text[1:]
-        
-        # Capitalize "I" when standalone
-        text = re.sub(r'\bi\b', 'I', text)
-        
-        # Common contractions
-        contractions = {
-            r'\bI M\b': "I'm",
-            r'\bDONT\b': "don't",
-            r'\bWONT\b': "won't",
-            r'\bCANT\b': "can't",
-            r'\bYOURE\b': "you're",
-            r'\bTHEYRE\b': "they're",
-            r'\bWERE\b': "we're",
-            r'\bILL\b': "I'll",
-            r'\bYOULL\b': "you'll",
-        }
-        
-        for pattern, replacement in contractions.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        
-        return text
-    
-    def check_timeout(self) -> Tuple[bool, bool]:
-        """Check for word and sentence timeouts.
+            now: Current time on the clock given to add_gesture
+                (uses time.monotonic() if None)
         
         Returns:
             (word_timeout, sentence_timeout) booleans
@@ -260,37 +475,44 @@ class SentenceConstructor:
         if self._last_gesture_time == 0:
             return False, False
         
-        elapsed = time.time() - self._last_gesture_time
+        elapsed = (time.monotonic() if now is None else now) - self._last_gesture_time
         
         word_timeout = elapsed >= self.word_timeout
         sentence_timeout = elapsed >= self.sentence_timeout
         
         return word_timeout, sentence_timeout
     
-    def finalize_sentence(self) -> TranslationResult:
+    def finalize_sentence(self, now: Optional[float] = None) -> TranslationResult:
         """Finalize and return the complete sentence.
         
+        Args:
+            now: Current time on the clock given to add_gesture
+                (uses time.monotonic() if None)
+        
         Returns:
             TranslationResult with the complete translation
         """
+        if now is None:
+            now = time.monotonic()
+        
         # Finalize any pending word
-        self._finalize_word()
+        self._finalize_word(now)
         self._update_text()
         
         # Mark sequence as complete
         self._gesture_sequence.is_complete = True
-        self._gesture_sequence.translated_text = self._formatted_text
+        self._gesture_sequence.translated_text = self._formatted()
         self._gesture_sequence.translation_confidence = (
             self._gesture_sequence.average_confidence
         )
         
         # Create result
         result = TranslationResult(
-            text=self._formatted_text,
+            text=self._formatted(),
             confidence=self._gesture_sequence.average_confidence,
             source_sequence=self._gesture_sequence,
             gesture_count=len(self._gesture_sequence.gestures),
-            capture_duration=time.time() - self._sentence_start_time if self._sentence_start_time else 0,
+            capture_duration=now - self._sentence_start_time if self._sentence_start_time else 0,
             word_count=len(self._words),
             average_gesture_confidence=self._gesture_sequence.average_confidence
         )
@@ -300,7 +522,7 @@ class SentenceConstructor:
     def get_current_text(self) -> str:
         """Get current formatted text (may be incomplete)."""
         self._update_text()
-        return self._formatted_text
+        return self._formatted()
     
     def get_raw_text(self) -> str:
         """Get raw unformatted text."""
@@ -312,17 +534,23 @@ class SentenceConstructor:
         Returns:
             String showing words + current partial word
         """
-        parts = []
-        
-        # Add finalized words
-        for word in self._words:
-            parts.append(word)
-        
-        # Add current word in progress
+        joined = self._get_joined_words()
+        partial = self._current_word.get_text()
+        key = self._preview_key
+        if key is not None and key[0] is joined and key[1] is partial:
+            return self._preview
+        
+        self._preview = self._build_preview()
+        self._preview_key = (joined, partial)
+        return self._preview
+    
+    def _build_preview(self) -> str:
+        """Build the preview string from the current words."""
+        # Finalized words are already joined; add the word in progress
         if self._current_word.length > 0:
-            parts.append(f"[{self._current_word.get_text()}]")
-        
-        return " ".join(parts) if parts else "(waiting...)"
+            partial = f"[{self._current_word.get_text()}]"
+            return f"{self._get_joined_words()} {partial}" if self._words else partial
+        return self._get_joined_words() if self._words else "(waiting...)"
     
     def get_gesture_count(self) -> int:
         """Get total number of gestures in sequence."""
@@ -336,11 +564,15 @@ class SentenceConstructor:
         """Clear all accumulated data."""
         self._current_word = WordCandidate()
         self._words.clear()
+        self._joined_words = ""
+        self._joined_dirty = False
         self._gesture_sequence = GestureSequence()
         self._last_gesture_time = 0.0
         self._sentence_start_time = 0.0
         self._raw_text = ""
         self._formatted_text = ""
+        self._formatted_dirty = False
+        self._preview_key = None
     
     def remove_last_word(self) -> bool:
         """Remove the last word (for correction).
@@ -353,7 +585,7 @@ class SentenceConstructor:
             self._update_text()
             return True
         elif self._words:
-            self._words.pop()
+            self._pop_word()
             self._update_text()
             return True
         return False
@@ -365,16 +597,14 @@ class SentenceConstructor:
             True if a letter was removed
         """
         if self._current_word.length > 0:
-            self._current_word.letters.pop()
-            if self._current_word.confidences:
-                self._current_word.confidences.pop()
+            self._current_word.pop_letter()
             self._update_text()
             return True
         elif self._words:
             # Pop last word and convert to current partial word
-            last_word = self._words.pop()
+            last_word = self._pop_word()
             if len(last_word) > 1:
-                self._current_word.letters = list(last_word[:-1])
+                self._current_word.set_letters(list(last_word[:-1]))
             self._update_text()
             return True
         return False
@@ -412,6 +642,9 @@ class ContinuousSentenceBuilder:
         self._on_text_updated: Optional[callable] = None
         self._on_word_completed: Optional[callable] = None
         self._on_sentence_completed: Optional[callable] = None
+        
+        # Last (text, preview) sent to _on_text_updated
+        self._last_emitted: Optional[Tuple[str, str]] = None
     
     def set_on_text_updated(self, callback: callable):
         """Set callback for text updates."""
@@ -425,11 +658,17 @@ class ContinuousSentenceBuilder:
         """Set callback for sentence completion."""
         self._on_sentence_completed = callback
     
-    def add_gesture(self, gesture: RecognizedGesture):
-        """Add gesture and trigger appropriate callbacks."""
+    def add_gesture(self, gesture: RecognizedGesture, now: Optional[float] = None):
+        """Add gesture and trigger appropriate callbacks.
+        
+        Args:
+            gesture: The recognized gesture
+            now: Time of the gesture (uses time.monotonic() if None)
+        """
         prev_word_count = self.constructor.get_word_count()
         
-        text = self.constructor.add_gesture(gesture)
+        # Formatting is only needed when someone listens for the text
+        self.constructor.add_gesture(gesture, format_text=False, now=now)
         
         new_word_count = self.constructor.get_word_count()
         
@@ -439,33 +678,48 @@ class ContinuousSentenceBuilder:
                 self._on_word_completed(self.constructor._words[-1])
         
         # Notify text update
-        if self._on_text_updated and text:
-            self._on_text_updated(text, self.constructor.get_preview())
+        if self._on_text_updated:
+            text = self.constructor._formatted()
+            if text:
+                self._emit_text(text, self.constructor.get_preview())
     
-    def check_timeouts(self):
-        """Check and handle timeouts."""
-        word_timeout, sentence_timeout = self.constructor.check_timeout()
+    def check_timeouts(self, now: Optional[float] = None):
+        """Check and handle timeouts.
+        
+        Args:
+            now: Current time on the clock given to add_gesture
+                (uses time.monotonic() if None)
+        """
+        word_timeout, sentence_timeout = self.constructor.check_timeout(now)
         
         if sentence_timeout:
-            self.finalize()
+            self.finalize(now)
         elif word_timeout:
             # Force word finalization
             prev_count = self.constructor.get_word_count()
-            self.constructor._finalize_word()
+            self.constructor._finalize_word(now)
             self.constructor._update_text()
             
             if self.constructor.get_word_count() > prev_count:
                 if self._on_word_completed:
                     self._on_word_completed(self.constructor._words[-1])
                 if self._on_text_updated:
-                    self._on_text_updated(
+                    self._emit_text(
                         self.constructor.get_current_text(),
                         self.constructor.get_preview()
                     )
     
-    def finalize(self) -> TranslationResult:
+    def _emit_text(self, text: str, preview: str):
+        """Call the text callback unless text and preview are unchanged."""
+        update = (text, preview)
+        if update == self._last_emitted:
+            return
+        self._last_emitted = update
+        self._on_text_updated(text, preview)
+    
+    def finalize(self, now: Optional[float] = None) -> TranslationResult:
         """Finalize current sentence."""
-        result = self.constructor.finalize_sentence()
+        result = self.constructor.finalize_sentence(now)
         
         if self._on_sentence_completed and result.text:
             self._on_sentence_completed(result)
@@ -475,6 +729,7 @@ class ContinuousSentenceBuilder:
     def clear(self):
         """Clear and reset."""
         self.constructor.clear()
+        self._last_emitted = None
     
     def get_current_text(self) -> str:
         """Get current text."""
@@ -6,10 +6,80 @@ including letters, numbers, common words, and phrases.
 Supports both sign-to-text and text-to-sign lookups.
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Set, Iterator, Iterable
+from collections import deque
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 import json
 import os
+import sys
+
+
+# Longest character n-gram kept in the search index
+_NGRAM_SIZE = 3
+
+# Entries kept per memo for the per-frame label queries
+_LOOKUP_MEMO_SIZE = 512
+
+
+def _ngrams(text: str, size: int) -> Iterator[str]:
+    """Yield every substring of `text` with length `size`."""
+    for start in range(len(text) - size + 1):
+        yield text[start:start + size]
+
+
+# Default vocabulary tables, built by the first SignVocabulary in the process
+# and copied into later instances. Definitions and the pattern trie are
+# shared between instances and must be treated as read-only.
+_default_tables: Optional[Dict[str, Any]] = None
+
+
+@lru_cache(maxsize=512)
+def canonicalize_label(label: str) -> str:
+    """Return the interned, casefolded form used for vocabulary keys.
+    
+    Detectors can canonicalize a label once at output time; repeated calls
+    with the same label return the same string object.
+    """
+    return sys.intern(label.casefold())
+
+
+def _remember(memo: Dict[str, Any], key: str, value: Any) -> Any:
+    """Store a lookup result, evicting the oldest entry when full."""
+    if len(memo) >= _LOOKUP_MEMO_SIZE:
+        del memo[next(iter(memo))]
+    memo[key] = value
+    return value
+
+
+def _copy_tables(tables: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy SignVocabulary lookup tables so later additions stay local."""
+    return {
+        '_signs': dict(tables['_signs']),
+        '_gesture_to_def': dict(tables['_gesture_to_def']),
+        '_text_to_def': dict(tables['_text_to_def']),
+        '_word_patterns': dict(tables['_word_patterns']),
+        '_pattern_root': tables['_pattern_root'],
+        '_ngram_index': {gram: set(ids) for gram, ids in tables['_ngram_index'].items()},
+        '_sign_positions': dict(tables['_sign_positions']),
+        '_search_fields': dict(tables['_search_fields']),
+    }
+
+
+class _PatternNode:
+    """Trie node for letter-sequence word patterns.
+    
+    `fail` and `matches` are the Aho-Corasick failure link and the words
+    ending here (own word first, then shorter suffix matches).
+    """
+    __slots__ = ('children', 'word', 'fail', 'matches')
+    
+    def __init__(self):
+        self.children: Dict[str, "_PatternNode"] = {}
+        self.word: Optional[str] = None
+        self.fail: Optional["_PatternNode"] = None
+        self.matches: Tuple[str, ...] = ()
 
 
 class SignCategory(Enum):
@@ -22,7 +92,12 @@ class SignCategory(Enum):
     CONTROL = "control"  # Space, backspace, etc.
 
 
-@dataclass
+# Categories that count as complete words (a tuple: Enum hashing is a
+# Python-level call, so identity scans beat a set for two members)
+WORDLIKE_CATEGORIES = (SignCategory.WORD, SignCategory.PHRASE)
+
+
+@dataclass(slots=True)
 class SignDefinition:
     """Definition of a sign in the vocabulary.
     
@@ -33,7 +108,7 @@ class SignDefinition:
     category: SignCategory
     
     # Recognition info
-    gesture_labels: List[str]        # Labels that trigger this sign
+    gesture_labels: Tuple[str, ...]  # Labels that trigger this sign
     is_dynamic: bool = False         # Requires motion tracking
     min_confidence: float = 0.6      # Minimum confidence threshold
     
@@ -48,8 +123,8 @@ class SignDefinition:
     animation_data: Dict = field(default_factory=dict)
     
     # Synonyms and variations
-    synonyms: List[str] = field(default_factory=list)
-    variations: List[str] = field(default_factory=list)
+    synonyms: Tuple[str, ...] = ()
+    variations: Tuple[str, ...] = ()
     
     def __post_init__(self):
         if not self.display_text:
@@ -68,11 +143,44 @@ class SignVocabulary:
     
     def __init__(self):
         self._signs: Dict[str, SignDefinition] = {}
-        self._gesture_to_sign: Dict[str, str] = {}  # gesture_label -> sign_id
-        self._text_to_sign: Dict[str, str] = {}     # text -> sign_id
+        # Keys are casefolded, so lookups are case-insensitive
+        self._gesture_to_def: Dict[str, SignDefinition] = {}  # gesture_label -> sign
+        self._text_to_def: Dict[str, SignDefinition] = {}     # text -> sign
         self._word_patterns: Dict[str, str] = {}    # letter sequence -> word
+        self._pattern_root = _PatternNode()         # same patterns as a trie
+        
+        # Search index: lowercased 1..3-character n-gram -> sign ids, each
+        # sign's insertion position (for result ordering) and its lowercased
+        # text, description and labels (for verifying candidates)
+        self._ngram_index: Dict[str, Set[str]] = {}
+        self._sign_positions: Dict[str, int] = {}
+        self._search_fields: Dict[str, Tuple[str, ...]] = {}
+        
+        # Signs grouped by category, plus word-level signs (WORD and PHRASE)
+        # in vocabulary order; rebuilt lazily after the vocabulary changes
+        self._by_category: Optional[Dict[SignCategory, List[SignDefinition]]] = None
+        self._word_signs: List[SignDefinition] = []
         
-        self._load_default_vocabulary()
+        # Bumped whenever the vocabulary changes; callers that memoize
+        # results derived from it include this in their cache keys
+        self.version = 0
+        
+        # Per-label memos for the per-frame recognizer queries, label ->
+        # result (cleared whenever a sign is added)
+        self._gesture_text_memo: Dict[str, str] = {}
+        self._is_word_memo: Dict[str, bool] = {}
+        self._is_dynamic_memo: Dict[str, bool] = {}
+        
+        self._init_default_vocabulary()
+    
+    def _init_default_vocabulary(self):
+        """Populate the default vocabulary, building it once per process."""
+        global _default_tables
+        if _default_tables is None:
+            self._load_default_vocabulary()
+            _default_tables = _copy_tables(self.__dict__)
+        else:
+            self.__dict__.update(_copy_tables(_default_tables))
     
     def _load_default_vocabulary(self):
         """Load default ASL vocabulary."""
@@ -83,7 +191,7 @@ class SignVocabulary:
                 id=f"letter_{letter.lower()}",
                 text=letter,
                 category=SignCategory.LETTER,
-                gesture_labels=[letter, letter.lower()],
+                gesture_labels=(letter, letter.lower()),
                 is_dynamic=is_dynamic,
                 display_text=letter,
                 description=f"ASL letter {letter}"
@@ -97,7 +205,7 @@ class SignVocabulary:
                 id=f"number_{i}",
                 text=str(i),
                 category=SignCategory.NUMBER,
-                gesture_labels=[str(i), word],
+                gesture_labels=(str(i), word),
                 display_text=str(i),
                 description=f"Number {i}"
             ))
@@ -109,7 +217,7 @@ class SignVocabulary:
                 id="word_hello",
                 text="Hello",
                 category=SignCategory.WORD,
-                gesture_labels=["hello", "wave", "WAVE", "hi"],
+                gesture_labels=("hello", "wave", "WAVE", "hi"),
                 is_dynamic=True,
                 emoji="👋",
                 description="Wave hand for hello"
@@ -118,7 +226,7 @@ class SignVocabulary:
                 id="word_goodbye",
                 text="Goodbye",
                 category=SignCategory.WORD,
-                gesture_labels=["goodbye", "bye"],
+                gesture_labels=("goodbye", "bye"),
                 is_dynamic=True,
                 emoji="👋",
                 description="Wave goodbye"
@@ -129,7 +237,7 @@ class SignVocabulary:
                 id="word_thanks",
                 text="Thank you",
                 category=SignCategory.WORD,
-                gesture_labels=["thank_you", "thanks", "thankyou"],
+                gesture_labels=("thank_you", "thanks", "thankyou"),
                 emoji="🙏",
                 description="Touch chin and move forward"
             ),
@@ -137,14 +245,14 @@ class SignVocabulary:
                 id="word_please",
                 text="Please",
                 category=SignCategory.WORD,
-                gesture_labels=["please"],
+                gesture_labels=("please",),
                 description="Circular motion on chest"
             ),
             SignDefinition(
                 id="word_sorry",
                 text="Sorry",
                 category=SignCategory.WORD,
-                gesture_labels=["sorry"],
+                gesture_labels=("sorry",),
                 emoji="🙇",
                 description="Fist on chest in circular motion"
             ),
@@ -154,7 +262,7 @@ class SignVocabulary:
                 id="word_yes",
                 text="Yes",
                 category=SignCategory.WORD,
-                gesture_labels=["yes", "thumbs_up", "THUMBS_UP"],
+                gesture_labels=("yes", "thumbs_up", "THUMBS_UP"),
                 emoji="👍",
                 description="Fist nodding like a head"
             ),
@@ -162,7 +270,7 @@ class SignVocabulary:
                 id="word_no",
                 text="No",
                 category=SignCategory.WORD,
-                gesture_labels=["no", "thumbs_down", "THUMBS_DOWN"],
+                gesture_labels=("no", "thumbs_down", "THUMBS_DOWN"),
                 emoji="👎",
                 description="Index and middle finger tap thumb"
             ),
@@ -172,14 +280,14 @@ class SignVocabulary:
                 id="word_i",
                 text="I",
                 category=SignCategory.WORD,
-                gesture_labels=["i", "me", "I_POINT"],
+                gesture_labels=("i", "me", "I_POINT"),
                 description="Point to self"
             ),
             SignDefinition(
                 id="word_you",
                 text="You",
                 category=SignCategory.WORD,
-                gesture_labels=["you", "YOU_POINT"],
+                gesture_labels=("you", "YOU_POINT"),
                 description="Point to other person"
             ),
             
@@ -188,21 +296,21 @@ class SignVocabulary:
                 id="word_want",
                 text="Want",
                 category=SignCategory.WORD,
-                gesture_labels=["want"],
+                gesture_labels=("want",),
                 description="Hands pull toward body"
             ),
             SignDefinition(
                 id="word_need",
                 text="Need",
                 category=SignCategory.WORD,
-                gesture_labels=["need"],
+                gesture_labels=("need",),
                 description="X hand moves down"
             ),
             SignDefinition(
                 id="word_help",
                 text="Help",
                 category=SignCategory.WORD,
-                gesture_labels=["help"],
+                gesture_labels=("help",),
                 emoji="🆘",
                 description="Thumbs up on flat hand, lift up"
             ),
@@ -210,7 +318,7 @@ class SignVocabulary:
                 id="word_stop",
                 text="Stop",
                 category=SignCategory.WORD,
-                gesture_labels=["stop", "STOP_HAND"],
+                gesture_labels=("stop", "STOP_HAND"),
                 emoji="✋",
                 description="Flat hand chops into other palm"
             ),
@@ -218,7 +326,7 @@ class SignVocabulary:
                 id="word_love",
                 text="Love",
                 category=SignCategory.WORD,
-                gesture_labels=["love", "heart"],
+                gesture_labels=("love", "heart"),
                 emoji="❤️",
                 description="Cross arms over chest"
             ),
@@ -226,7 +334,7 @@ class SignVocabulary:
                 id="word_iloveyou",
                 text="I love you",
                 category=SignCategory.PHRASE,
-                gesture_labels=["i_love_you", "ily", "ILY"],
+                gesture_labels=("i_love_you", "ily", "ILY"),
                 emoji="🤟",
                 description="ILY handshape (thumb, index, pinky)"
             ),
@@ -236,21 +344,21 @@ class SignVocabulary:
                 id="word_what",
                 text="What?",
                 category=SignCategory.WORD,
-                gesture_labels=["what"],
+                gesture_labels=("what",),
                 description="Hands palm up, shake slightly"
             ),
             SignDefinition(
                 id="word_where",
                 text="Where?",
                 category=SignCategory.WORD,
-                gesture_labels=["where"],
+                gesture_labels=("where",),
                 description="Shake pointed index finger"
             ),
             SignDefinition(
                 id="word_how",
                 text="How?",
                 category=SignCategory.WORD,
-                gesture_labels=["how"],
+                gesture_labels=("how",),
                 description="Backs of hands together, roll forward"
             ),
             
@@ -259,14 +367,14 @@ class SignVocabulary:
                 id="word_name",
                 text="Name",
                 category=SignCategory.WORD,
-                gesture_labels=["name"],
+                gesture_labels=("name",),
                 description="H hands tap each other"
             ),
             SignDefinition(
                 id="word_water",
                 text="Water",
                 category=SignCategory.WORD,
-                gesture_labels=["water"],
+                gesture_labels=("water",),
                 emoji="💧",
                 description="W hand taps chin"
             ),
@@ -274,7 +382,7 @@ class SignVocabulary:
                 id="word_food",
                 text="Food",
                 category=SignCategory.WORD,
-                gesture_labels=["food", "eat"],
+                gesture_labels=("food", "eat"),
                 emoji="🍽️",
                 description="Flat O to mouth"
             ),
@@ -289,7 +397,7 @@ class SignVocabulary:
                 id="ctrl_space",
                 text=" ",
                 category=SignCategory.CONTROL,
-                gesture_labels=["space", "SPACE", "_"],
+                gesture_labels=("space", "SPACE", "_"),
                 display_text="[SPACE]",
                 description="Space between words"
             ),
@@ -297,7 +405,7 @@ class SignVocabulary:
                 id="ctrl_backspace",
                 text="[DELETE]",
                 category=SignCategory.CONTROL,
-                gesture_labels=["backspace", "delete"],
+                gesture_labels=("backspace", "delete"),
                 display_text="[DELETE]",
                 description="Delete last character"
             ),
@@ -305,7 +413,7 @@ class SignVocabulary:
                 id="ctrl_enter",
                 text="[ENTER]",
                 category=SignCategory.CONTROL,
-                gesture_labels=["enter", "newline"],
+                gesture_labels=("enter", "newline"),
                 display_text="[ENTER]",
                 description="New line / Confirm"
             ),
@@ -341,45 +449,88 @@ class SignVocabulary:
             "WHO": "Who",
             "WHY": "Why",
         }
+        self._build_pattern_trie()
     
     def _add_sign(self, sign: SignDefinition):
         """Add a sign to the vocabulary."""
+        self._insert_sign(sign)
+        self._clear_lookup_caches()
+    
+    def _insert_sign(self, sign: SignDefinition):
+        """Index a sign without invalidating cached lookups."""
+        if type(sign.gesture_labels) is not tuple:
+            sign.gesture_labels = tuple(sign.gesture_labels)
+        if type(sign.synonyms) is not tuple:
+            sign.synonyms = tuple(sign.synonyms)
+        previous = self._signs.get(sign.id)
+        if previous is None:
+            self._sign_positions[sign.id] = len(self._sign_positions)
+        elif previous is not sign:
+            self._repoint_keys(previous, sign)
         self._signs[sign.id] = sign
+        self._index_for_search(sign)
         
-        # Map gesture labels to sign
+        # Map gesture labels to sign (canonical keys are interned, so
+        # canonicalized lookups hit the identity fast path)
+        gesture_to_def = self._gesture_to_def
         for label in sign.gesture_labels:
-            self._gesture_to_sign[label.upper()] = sign.id
-            self._gesture_to_sign[label.lower()] = sign.id
+            gesture_to_def[canonicalize_label(label)] = sign
         
-        # Map text to sign
-        self._text_to_sign[sign.text.upper()] = sign.id
-        self._text_to_sign[sign.text.lower()] = sign.id
-        
-        # Add synonyms
+        # Map text and synonyms to sign
+        text_to_def = self._text_to_def
+        text_to_def[canonicalize_label(sign.text)] = sign
         for syn in sign.synonyms:
-            self._text_to_sign[syn.upper()] = sign.id
-            self._text_to_sign[syn.lower()] = sign.id
+            text_to_def[canonicalize_label(syn)] = sign
+    
+    def _repoint_keys(self, previous: SignDefinition, sign: SignDefinition):
+        """Point keys of a replaced definition at its replacement."""
+        for mapping in (self._gesture_to_def, self._text_to_def):
+            for key, value in mapping.items():
+                if value is previous:
+                    mapping[key] = sign
+    
+    def _clear_lookup_caches(self):
+        """Drop memoized lookups after the vocabulary changes."""
+        self.version += 1
+        self._by_category = None
+        self._gesture_text_memo.clear()
+        self._is_word_memo.clear()
+        self._is_dynamic_memo.clear()
+    
+    def _index_for_search(self, sign: SignDefinition):
+        """Add a sign's searchable strings to the n-gram index."""
+        index = self._ngram_index
+        fields = (sign.text.lower(), sign.description.lower(),
+                  *(label.lower() for label in sign.gesture_labels))
+        self._search_fields[sign.id] = fields
+        for text in fields:
+            for size in range(1, _NGRAM_SIZE + 1):
+                for gram in _ngrams(text, size):
+                    ids = index.get(gram)
+                    if ids is None:
+                        index[gram] = {sign.id}
+                    else:
+                        ids.add(sign.id)
     
     def get_sign_by_gesture(self, gesture_label: str) -> Optional[SignDefinition]:
-        """Look up sign by gesture label (for sign-to-text)."""
-        sign_id = self._gesture_to_sign.get(gesture_label)
-        if sign_id:
-            return self._signs.get(sign_id)
-        return None
+        """Look up sign by gesture label (for sign-to-text, case-insensitive)."""
+        return self._gesture_to_def.get(canonicalize_label(gesture_label))
     
     def get_sign_by_text(self, text: str) -> Optional[SignDefinition]:
-        """Look up sign by text (for text-to-sign)."""
-        sign_id = self._text_to_sign.get(text)
-        if not sign_id:
-            sign_id = self._text_to_sign.get(text.upper())
-        if not sign_id:
-            sign_id = self._text_to_sign.get(text.lower())
-        if sign_id:
-            return self._signs.get(sign_id)
-        return None
+        """Look up sign by text (for text-to-sign, case-insensitive)."""
+        return self._text_to_def.get(text.casefold())
     
     def gesture_to_text(self, gesture_label: str) -> str:
         """Convert gesture label to text representation."""
+        try:
+            return self._gesture_text_memo[gesture_label]
+        except KeyError:
+            return _remember(
+                self._gesture_text_memo, gesture_label,
+                self._gesture_to_text_impl(gesture_label)
+            )
+    
+    def _gesture_to_text_impl(self, gesture_label: str) -> str:
         sign = self.get_sign_by_gesture(gesture_label)
         if sign:
             return sign.display_text
@@ -391,50 +542,182 @@ class SignVocabulary:
     
     def recognize_word_pattern(self, letters: str) -> Optional[str]:
         """Try to recognize a word from a sequence of letters."""
-        upper = letters.upper()
-        if upper in self._word_patterns:
-            return self._word_patterns[upper]
-        return None
+        return self._word_patterns.get(letters.upper())
+    
+    def _build_pattern_trie(self):
+        """Rebuild the pattern trie from self._word_patterns."""
+        root = _PatternNode()
+        for pattern, word in self._word_patterns.items():
+            node = root
+            for letter in pattern:
+                child = node.children.get(letter)
+                if child is None:
+                    child = node.children[letter] = _PatternNode()
+                node = child
+            node.word = word
+        
+        # Failure links, breadth-first, for stream_match
+        root.fail = root
+        queue = deque()
+        for child in root.children.values():
+            child.fail = root
+            child.matches = (child.word,) if child.word is not None else ()
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for letter, child in node.children.items():
+                fail = node.fail
+                while letter not in fail.children and fail is not root:
+                    fail = fail.fail
+                child.fail = fail.children.get(letter, root)
+                own = (child.word,) if child.word is not None else ()
+                child.matches = own + child.fail.matches
+                queue.append(child)
+        self._pattern_root = root
+    
+    def walk_word_pattern(
+        self,
+        letters: str,
+        node: Optional[_PatternNode] = None
+    ) -> Optional[_PatternNode]:
+        """Advance through the pattern trie by `letters`.
+        
+        For streamed input, keep the returned node and pass it back with
+        only the new letters instead of re-walking from the root.
+        
+        Args:
+            letters: Letters to consume (case-insensitive)
+            node: Node to start from (the root if None)
+            
+        Returns:
+            The node reached, or None if no pattern starts this way
+        """
+        if node is None:
+            node = self._pattern_root
+        for letter in letters.upper():
+            node = node.children.get(letter)
+            if node is None:
+                return None
+        return node
+    
+    def stream_match(self, letters: Iterable[str]) -> Iterator[Tuple[int, str]]:
+        """Find word patterns anywhere in a stream of letters.
+        
+        Consumes one letter at a time (O(1) amortized per letter), so it
+        can run directly over a live letter feed.
+        
+        Args:
+            letters: Iterable of single letters (case-insensitive)
+            
+        Yields:
+            (index of the pattern's last letter, word), longest match first
+            at each position
+        """
+        root = self._pattern_root
+        node = root
+        for index, letter in enumerate(letters):
+            letter = letter.upper()
+            while letter not in node.children and node is not root:
+                node = node.fail
+            node = node.children.get(letter, root)
+            for word in node.matches:
+                yield index, word
+    
+    def match_prefix(self, letters: str) -> Tuple[Optional[str], bool]:
+        """Match a (possibly partial) letter sequence against word patterns.
+        
+        Returns:
+            (completed_word or None, whether longer patterns continue it);
+            (None, False) means no pattern can match, so spelling can stop
+            looking
+        """
+        node = self.walk_word_pattern(letters)
+        if node is None:
+            return None, False
+        return node.word, bool(node.children)
     
     def is_word_gesture(self, gesture_label: str) -> bool:
         """Check if gesture represents a complete word."""
+        try:
+            return self._is_word_memo[gesture_label]
+        except KeyError:
+            return _remember(
+                self._is_word_memo, gesture_label,
+                self._is_word_gesture_impl(gesture_label)
+            )
+    
+    def _is_word_gesture_impl(self, gesture_label: str) -> bool:
         sign = self.get_sign_by_gesture(gesture_label)
-        if sign:
-            return sign.category in [SignCategory.WORD, SignCategory.PHRASE]
-        return False
+        return sign is not None and sign.category in WORDLIKE_CATEGORIES
     
     def is_dynamic_gesture(self, gesture_label: str) -> bool:
         """Check if gesture requires motion tracking."""
+        try:
+            return self._is_dynamic_memo[gesture_label]
+        except KeyError:
+            return _remember(
+                self._is_dynamic_memo, gesture_label,
+                self._is_dynamic_gesture_impl(gesture_label)
+            )
+    
+    def _is_dynamic_gesture_impl(self, gesture_label: str) -> bool:
         sign = self.get_sign_by_gesture(gesture_label)
         if sign:
             return sign.is_dynamic
         return False
     
+    def _category_buckets(self) -> Dict[SignCategory, List[SignDefinition]]:
+        """Return signs bucketed by category, in vocabulary order."""
+        buckets = self._by_category
+        if buckets is None:
+            buckets = {category: [] for category in SignCategory}
+            words = []
+            for sign in self._signs.values():
+                buckets[sign.category].append(sign)
+                if sign.category in WORDLIKE_CATEGORIES:
+                    words.append(sign)
+            self._word_signs = words
+            self._by_category = buckets
+        return buckets
+    
     def get_all_words(self) -> List[SignDefinition]:
         """Get all word-level signs in vocabulary."""
-        return [
-            s for s in self._signs.values() 
-            if s.category in [SignCategory.WORD, SignCategory.PHRASE]
-        ]
+        self._category_buckets()
+        return list(self._word_signs)
     
     def get_all_letters(self) -> List[SignDefinition]:
         """Get all letter signs in vocabulary."""
-        return [
-            s for s in self._signs.values()
-            if s.category == SignCategory.LETTER
-        ]
+        return list(self._category_buckets()[SignCategory.LETTER])
     
     def search_vocabulary(self, query: str) -> List[SignDefinition]:
         """Search vocabulary by text, description, or labels."""
         query_lower = query.lower()
-        results = []
+        if not query_lower:
+            return list(self._signs.values())
+        
+        # Candidates must contain every n-gram of the query
+        index = self._ngram_index
+        if len(query_lower) <= _NGRAM_SIZE:
+            candidates = index.get(query_lower, ())
+        else:
+            gram_sets = []
+            for gram in set(_ngrams(query_lower, _NGRAM_SIZE)):
+                ids = index.get(gram)
+                if not ids:
+                    return []
+                gram_sets.append(ids)
+            gram_sets.sort(key=len)
+            candidates = gram_sets[0].intersection(*gram_sets[1:])
         
-        for sign in self._signs.values():
-            if (query_lower in sign.text.lower() or
-                query_lower in sign.description.lower() or
-                any(query_lower in label.lower() for label in sign.gesture_labels)):
-                results.append(sign)
+        # Verify against the current definitions (the index only grows, so
+        # it may hold stale ids for replaced signs)
+        search_fields = self._search_fields
+        results = []
+        for sign_id in candidates:
+            if any(query_lower in text for text in search_fields[sign_id]):
+                results.append(self._signs[sign_id])
         
+        results.sort(key=lambda sign: self._sign_positions[sign.id])
         return results
     
     def add_custom_word(self, text: str, gesture_labels: List[str], 
@@ -443,30 +726,55 @@ class SignVocabulary:
         
         Returns the sign ID of the new word.
         """
-        sign_id = f"custom_{text.lower().replace(' ', '_')}"
+        return self.add_custom_words([{
+            'text': text,
+            'gesture_labels': gesture_labels,
+            'description': description,
+            'emoji': emoji,
+        }])[0]
+    
+    def add_custom_words(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """Add several custom words, invalidating cached lookups once.
         
-        sign = SignDefinition(
-            id=sign_id,
-            text=text,
-            category=SignCategory.WORD,
-            gesture_labels=gesture_labels,
-            description=description,
-            emoji=emoji
-        )
+        Args:
+            entries: Dicts with 'text' and 'gesture_labels', and optionally
+                'description' and 'emoji' (as for add_custom_word)
+            
+        Returns:
+            The sign IDs of the new words, in order
+        """
+        sign_ids = []
+        for entry in entries:
+            text = entry['text']
+            sign_id = f"custom_{text.lower().replace(' ', '_')}"
+            
+            self._insert_sign(SignDefinition(
+                id=sign_id,
+                text=text,
+                category=SignCategory.WORD,
+                gesture_labels=entry['gesture_labels'],
+                description=entry.get('description', ""),
+                emoji=entry.get('emoji', "")
+            ))
+            sign_ids.append(sign_id)
         
-        self._add_sign(sign)
-        return sign_id
+        if sign_ids:
+            self._clear_lookup_caches()
+        return sign_ids
     
     def export_vocabulary(self) -> Dict:
         """Export vocabulary to dictionary for saving."""
-        return {
-            sign_id: {
-                'text': sign.text,
-                'category': sign.category.value,
-                'gesture_labels': sign.gesture_labels,
-                'is_dynamic': sign.is_dynamic,
-                'description': sign.description,
-                'emoji': sign.emoji
+        fields = attrgetter('text', 'category.value', 'gesture_labels',
+                            'is_dynamic', 'description', 'emoji')
+        exported = {}
+        for sign_id, sign in self._signs.items():
+            text, category, labels, is_dynamic, description, emoji = fields(sign)
+            exported[sign_id] = {
+                'text': text,
+                'category': category,
+                'gesture_labels': list(labels),
+                'is_dynamic': is_dynamic,
+                'description': description,
+                'emoji': emoji
             }
-            for sign_id, sign in self._signs.items()
-        }
+        return exported
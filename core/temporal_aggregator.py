@@ -7,28 +7,47 @@ This module handles temporal analysis of gesture sequences:
 - Aggregating consecutive frames into stable gesture recognitions
 - Handling transitions between gestures
 """
-import time
+import sys
 import numpy as np
-from collections import deque
 from typing import Optional, List, Tuple, Dict, Callable
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 
 from .gesture_sequence import (
     GestureFrame, RecognizedGesture, GestureType, 
-    GestureConfidence
+    GestureConfidence, LANDMARK_SHAPE, confidence_levels
 )
 
 
-class AggregationState(Enum):
+# Vote sums are kept as integers in units of the smallest double step
+# (2**-1074), so every float confidence converts exactly and removing an
+# evicted confidence leaves no rounding residue
+_VOTE_UNITS_PER_ONE = 1 << 1074
+
+
+def _to_vote_units(confidence: float) -> int:
+    """Exact integer value of a confidence in vote units."""
+    numerator, denominator = float(confidence).as_integer_ratio()
+    return numerator * (_VOTE_UNITS_PER_ONE // denominator)
+
+
+_AGGREGATION_STATE_NAMES = ("idle", "tracking", "stable", "transitioning")
+
+
+class AggregationState(IntEnum):
     """States for the temporal aggregation FSM."""
-    IDLE = "idle"                    # No hand detected
-    TRACKING = "tracking"            # Hand detected, building gesture
-    STABLE = "stable"                # Gesture is stable
-    TRANSITIONING = "transitioning"  # Transitioning between gestures
+    IDLE = 0            # No hand detected
+    TRACKING = 1        # Hand detected, building gesture
+    STABLE = 2          # Gesture is stable
+    TRANSITIONING = 3   # Transitioning between gestures
+    
+    @property
+    def label(self) -> str:
+        """Serialized name (e.g. "idle")."""
+        return _AGGREGATION_STATE_NAMES[self]
 
 
-@dataclass
+@dataclass(slots=True)
 class GestureCandidate:
     """A candidate gesture being tracked during aggregation."""
     label: str
@@ -43,6 +62,12 @@ class GestureCandidate:
     confidences: List[float] = field(default_factory=list)
     peak_confidence: float = 0.0
     
+    # Running sum, mean and sum of squared deviations of `confidences`
+    # (Welford), so averages and consistency need no pass over the list
+    conf_sum: float = 0.0
+    conf_mean: float = 0.0
+    conf_m2: float = 0.0
+    
     # Timing
     start_time: float = 0.0
     last_seen_time: float = 0.0
@@ -55,16 +80,49 @@ class GestureCandidate:
     def average_confidence(self) -> float:
         if not self.confidences:
             return 0.0
-        return sum(self.confidences) / len(self.confidences)
+        return self.conf_sum / len(self.confidences)
     
     @property
     def consistency(self) -> float:
         """How consistent this gesture has been (0-1)."""
-        if len(self.confidences) < 2:
+        n = len(self.confidences)
+        if n < 2:
             return 1.0
         # Lower variance = higher consistency
-        variance = np.var(self.confidences)
+        variance = self.conf_m2 / n
         return max(0.0, 1.0 - variance)
+    
+    def add_confidence(self, confidence: float):
+        """Record a frame's confidence and update the running statistics."""
+        self.confidences.append(confidence)
+        self.conf_sum += confidence
+        if confidence > self.peak_confidence:
+            self.peak_confidence = confidence
+        delta = confidence - self.conf_mean
+        self.conf_mean += delta / len(self.confidences)
+        self.conf_m2 += delta * (confidence - self.conf_mean)
+    
+    def reset(
+        self,
+        label: str,
+        gesture_type: GestureType,
+        frame_id: int,
+        timestamp: float
+    ):
+        """Reinitialize in place to track a new gesture from `frame_id`."""
+        self.label = label
+        self.gesture_type = gesture_type
+        self.start_frame = frame_id
+        self.end_frame = frame_id
+        # Finalized gestures keep the previous list, so start a new one
+        self.frame_ids = [frame_id]
+        self.confidences.clear()
+        self.peak_confidence = 0.0
+        self.conf_sum = 0.0
+        self.conf_mean = 0.0
+        self.conf_m2 = 0.0
+        self.start_time = timestamp
+        self.last_seen_time = timestamp
 
 
 class TemporalAggregator:
@@ -105,15 +163,59 @@ class TemporalAggregator:
         self.transition_frames = transition_frames
         self.fps = fps
         
-        # Frame buffer
-        self._frame_buffer: deque[GestureFrame] = deque(maxlen=window_size)
-        
-        # Prediction history for voting
-        self._prediction_history: deque[Tuple[str, float]] = deque(maxlen=window_size)
-        
-        # Current state
+        # Derived thresholds (the window size is fixed by the buffers below,
+        # so these are computed once rather than per frame)
+        self._half_window = window_size // 2
+        self._half_stability = stability_threshold // 2
+        
+        # Frame ring buffer (struct-of-arrays): one contiguous (window, 21, 3)
+        # landmark block plus per-frame type codes and confidences, instead
+        # of holding references to per-frame objects
+        self._landmarks_buf = np.zeros((window_size, *LANDMARK_SHAPE), dtype=np.float32)
+        self._types_buf = np.full(window_size, GestureType.UNKNOWN, dtype=np.int8)
+        self._confidences_buf = np.zeros(window_size, dtype=np.float32)
+        self._buffered_frames = 0
+        
+        # Prediction history for voting: a ring buffer of labels and
+        # confidences (in vote units), with per-label tallies kept up to
+        # date as entries enter and leave the window. Pushes are numbered
+        # from 0 since the last clear; each slot also records the number
+        # of the next push with the same label (-1 if none yet), so a
+        # label's first position in the window is known after an eviction
+        self._history_labels: List[Optional[str]] = [None] * window_size
+        self._history_units: List[int] = [0] * window_size
+        self._history_next: List[int] = [-1] * window_size
+        self._history_head = 0   # slot the next prediction overwrites
+        self._history_len = 0
+        self._history_seq = 0    # number of the next push
+        self._vote_counts: Dict[str, int] = {}
+        self._vote_sums: Dict[str, int] = {}
+        self._vote_first: Dict[str, int] = {}   # oldest push still in window
+        self._vote_last: Dict[str, int] = {}    # newest push
+        
+        # Current voting winner, kept up to date on each push; only
+        # evicting a prediction of the leader forces a rescan
+        self._leader: Optional[str] = None
+        self._leader_stale = True
+        
+        # Current state, and the handler _update_state dispatches to for
+        # each state (indexed by the state's value)
         self._state = AggregationState.IDLE
+        self._state_handlers: Tuple[Callable, ...] = (
+            self._on_idle,
+            self._on_tracking,
+            self._on_stable,
+            self._on_transitioning,
+        )
         self._current_candidate: Optional[GestureCandidate] = None
+        # Reused for every candidate (_current_candidate points at it while
+        # a gesture is being tracked)
+        self._candidate_slot = GestureCandidate(
+            label="",
+            gesture_type=GestureType.UNKNOWN,
+            start_frame=0,
+            end_frame=0
+        )
         self._last_stable_gesture: Optional[RecognizedGesture] = None
         
         # Frame counter
@@ -136,11 +238,19 @@ class TemporalAggregator:
         """Set callback for state changes."""
         self._on_state_change = callback
     
-    def process_frame(self, frame: GestureFrame) -> Optional[RecognizedGesture]:
+    def process_frame(
+        self,
+        frame: GestureFrame,
+        now: Optional[float] = None
+    ) -> Optional[RecognizedGesture]:
         """Process a new frame and return recognized gesture if stable.
         
+        The frame is not retained (its data is copied into the ring
+        buffer), so callers may reuse frame objects between calls.
+        
         Args:
             frame: The gesture frame to process
+            now: Current time (defaults to frame.timestamp)
             
         Returns:
             RecognizedGesture if a stable gesture is recognized, None otherwise
@@ -149,28 +259,21 @@ class TemporalAggregator:
         frame.frame_id = self._frame_count
         
         # Add to buffer
-        self._frame_buffer.append(frame)
+        self._store_slot(frame.landmarks, frame.gesture_type, frame.confidence)
         
         # Handle no hand detection
         if not frame.hand_detected:
-            self._no_hand_count += 1
-            
-            # If we were tracking a gesture, check if we should finalize it
-            if self._state == AggregationState.TRACKING and self._current_candidate:
-                if self._no_hand_count > self.transition_frames:
-                    return self._finalize_gesture()
-            
-            if self._no_hand_count > self.window_size // 2:
-                self._change_state(AggregationState.IDLE)
-            
-            return None
+            return self._handle_no_hand()
         
         # Reset no-hand counter
         self._no_hand_count = 0
         
-        # Add prediction to history if valid
-        if frame.predicted_label and frame.confidence >= self.min_confidence:
-            self._prediction_history.append((frame.predicted_label, frame.confidence))
+        # Add prediction to history if valid (interned, so tally lookups
+        # and label comparisons downstream mostly resolve by identity)
+        label = frame.predicted_label
+        confidence = frame.confidence
+        if label and confidence >= self.min_confidence:
+            self._push_prediction(sys.intern(str(label)), confidence)
         
         # Perform temporal voting
         voted_label, voted_confidence = self._perform_voting()
@@ -179,46 +282,165 @@ class TemporalAggregator:
             return None
         
         # Update state machine
-        return self._update_state(voted_label, voted_confidence, frame)
+        return self._update_state(
+            voted_label, voted_confidence, frame,
+            frame.timestamp if now is None else now
+        )
     
-    def _perform_voting(self) -> Tuple[Optional[str], float]:
-        """Perform confidence-weighted voting on prediction history.
+    def process_empty_frame(
+        self,
+        gesture_type: GestureType = GestureType.STATIC,
+        confidence: float = 0.0
+    ) -> Optional[RecognizedGesture]:
+        """Record a frame with no hand without building a GestureFrame.
+        
+        Equivalent to process_frame() with hand_detected=False.
         
+        Args:
+            gesture_type: Reported gesture type for the frame
+            confidence: Reported confidence for the frame
+            
         Returns:
-            (winning_label, aggregated_confidence) or (None, 0.0)
+            RecognizedGesture if a tracked gesture is finalized, None otherwise
         """
-        if len(self._prediction_history) < 2:
-            return None, 0.0
+        self._frame_count += 1
+        self._store_slot(None, gesture_type, confidence)
+        return self._handle_no_hand()
+    
+    def _handle_no_hand(self) -> Optional[RecognizedGesture]:
+        """Advance no-hand tracking; may finalize the current gesture."""
+        self._no_hand_count += 1
         
-        # Aggregate votes by label
-        label_votes: Dict[str, List[float]] = {}
+        # If we were tracking a gesture, check if we should finalize it
+        if self._state == AggregationState.TRACKING and self._current_candidate:
+            if self._no_hand_count > self.transition_frames:
+                return self._finalize_gesture()
         
-        for label, confidence in self._prediction_history:
-            if label not in label_votes:
-                label_votes[label] = []
-            label_votes[label].append(confidence)
+        if self._no_hand_count > self._half_window:
+            self._change_state(AggregationState.IDLE)
         
-        # Find winner
+        return None
+    
+    def _store_slot(
+        self,
+        landmarks: Optional[np.ndarray],
+        gesture_type: GestureType,
+        confidence: float
+    ):
+        """Copy one frame's data into the next ring buffer slot."""
+        slot = self._buffered_frames % self.window_size
+        if landmarks is not None and np.size(landmarks) == self._landmarks_buf[slot].size:
+            self._landmarks_buf[slot] = np.reshape(landmarks, LANDMARK_SHAPE)
+        else:
+            self._landmarks_buf[slot] = 0.0
+        self._types_buf[slot] = gesture_type
+        self._confidences_buf[slot] = confidence
+        self._buffered_frames += 1
+    
+    def _push_prediction(self, label: str, confidence: float):
+        """Add a prediction to the history, evicting the oldest if full."""
+        counts = self._vote_counts
+        sums = self._vote_sums
+        head = self._history_head
+        
+        if self._history_len == self.window_size:
+            old_label = self._history_labels[head]
+            if old_label == self._leader:
+                self._leader_stale = True
+            remaining = counts[old_label] - 1
+            if remaining:
+                counts[old_label] = remaining
+                sums[old_label] -= self._history_units[head]
+                self._vote_first[old_label] = self._history_next[head]
+            else:
+                del counts[old_label], sums[old_label]
+                del self._vote_first[old_label], self._vote_last[old_label]
+        else:
+            self._history_len += 1
+        
+        units = _to_vote_units(confidence)
+        seq = self._history_seq
+        self._history_labels[head] = label
+        self._history_units[head] = units
+        self._history_next[head] = -1
+        self._history_seq = seq + 1
+        head += 1
+        self._history_head = 0 if head == self.window_size else head
+        
+        if label in counts:
+            counts[label] += 1
+            sums[label] += units
+            self._history_next[self._vote_last[label] % self.window_size] = seq
+        else:
+            counts[label] = 1
+            sums[label] = units
+            self._vote_first[label] = seq
+        self._vote_last[label] = seq
+        
+        # Only the pushed label gained, and an evicted non-leader only lost
+        # score and moved its first position later, so the pushed label
+        # is the only possible challenger
+        if not self._leader_stale and label != self._leader:
+            leader = self._leader
+            total = sums[label]
+            if leader is None:
+                if total > 0:
+                    self._leader = label
+            elif total > sums[leader] or (
+                total == sums[leader] and self._vote_first[label] < self._vote_first[leader]
+            ):
+                self._leader = label
+    
+    def _find_leader(self) -> Optional[str]:
+        """Scan the tallies for the highest-scoring label.
+        
+        Score = count * average_confidence, i.e. the label's confidence
+        sum (compared exactly). A tie goes to the label whose first
+        prediction in the window is oldest, and a label needs a positive
+        score to win.
+        """
+        sums = self._vote_sums
+        first = self._vote_first
         best_label = None
-        best_score = 0.0
+        best_sum = 0
+        best_first = 0
+        
+        if len(sums) == 1:
+            # A sole label wins outright if it carries any weight
+            for label, total in sums.items():
+                if total > 0:
+                    best_label = label
+        else:
+            for label, total in sums.items():
+                if total > best_sum or (
+                    total == best_sum and best_label is not None and first[label] < best_first
+                ):
+                    best_label = label
+                    best_sum = total
+                    best_first = first[label]
+        
+        self._leader = best_label
+        self._leader_stale = False
+        return best_label
+    
+    def _perform_voting(self) -> Tuple[Optional[str], float]:
+        """Perform confidence-weighted voting on prediction history.
         
-        for label, confidences in label_votes.items():
-            # Score = count * average_confidence
-            count = len(confidences)
-            avg_conf = sum(confidences) / count
-            score = count * avg_conf
-            
-            if score > best_score:
-                best_score = score
-                best_label = label
+        Returns:
+            (winning_label, aggregated_confidence) or (None, 0.0)
+        """
+        if self._history_len < 2:
+            return None, 0.0
         
+        # Find winner
+        best_label = self._find_leader() if self._leader_stale else self._leader
         if best_label is None:
             return None, 0.0
         
         # Calculate final confidence
-        label_confidences = label_votes[best_label]
-        consistency = len(label_confidences) / len(self._prediction_history)
-        avg_confidence = sum(label_confidences) / len(label_confidences)
+        best_count = self._vote_counts[best_label]
+        consistency = best_count / self._history_len
+        avg_confidence = self._vote_sums[best_label] / _VOTE_UNITS_PER_ONE / best_count
         
         # Require minimum consistency (e.g., 40% of frames agree)
         if consistency < 0.4:
@@ -233,7 +455,8 @@ class TemporalAggregator:
         self, 
         label: str, 
         confidence: float, 
-        frame: GestureFrame
+        frame: GestureFrame,
+        current_time: float
     ) -> Optional[RecognizedGesture]:
         """Update state machine and return gesture if recognized.
         
@@ -241,64 +464,89 @@ class TemporalAggregator:
             label: Voted gesture label
             confidence: Aggregated confidence
             frame: Current frame
+            current_time: Timestamp of the current frame
             
         Returns:
             RecognizedGesture if stable, None otherwise
         """
-        current_time = time.time()
-        
-        if self._state == AggregationState.IDLE:
-            # Start tracking new gesture
+        return self._state_handlers[self._state](label, confidence, frame, current_time)
+    
+    def _on_idle(
+        self,
+        label: str,
+        confidence: float,
+        frame: GestureFrame,
+        current_time: float
+    ) -> Optional[RecognizedGesture]:
+        """IDLE: start tracking a new gesture."""
+        self._start_candidate(label, frame.gesture_type, frame.frame_id, current_time)
+        self._change_state(AggregationState.TRACKING)
+        return None
+    
+    def _on_tracking(
+        self,
+        label: str,
+        confidence: float,
+        frame: GestureFrame,
+        current_time: float
+    ) -> Optional[RecognizedGesture]:
+        """TRACKING: grow the candidate until stable, or switch gestures."""
+        if self._current_candidate is None:
             self._start_candidate(label, frame.gesture_type, frame.frame_id, current_time)
-            self._change_state(AggregationState.TRACKING)
             return None
         
-        elif self._state == AggregationState.TRACKING:
-            if self._current_candidate is None:
-                self._start_candidate(label, frame.gesture_type, frame.frame_id, current_time)
-                return None
+        if label == self._current_candidate.label:
+            # Same gesture - update candidate
+            self._update_candidate(frame.frame_id, confidence, current_time)
             
-            if label == self._current_candidate.label:
-                # Same gesture - update candidate
-                self._update_candidate(frame.frame_id, confidence, current_time)
-                
-                # Check if stable
-                if self._current_candidate.duration_frames >= self.stability_threshold:
-                    self._change_state(AggregationState.STABLE)
-                    return self._finalize_gesture()
-            else:
-                # Different gesture - start transition
-                self._change_state(AggregationState.TRANSITIONING)
-                
-                # If current candidate was substantial, finalize it first
-                if self._current_candidate.duration_frames >= self.stability_threshold // 2:
-                    gesture = self._finalize_gesture()
-                    self._start_candidate(label, frame.gesture_type, frame.frame_id, current_time)
-                    return gesture
-                else:
-                    # Abandon short candidate, start new one
-                    self._start_candidate(label, frame.gesture_type, frame.frame_id, current_time)
+            # Check if stable
+            if self._current_candidate.duration_frames >= self.stability_threshold:
+                self._change_state(AggregationState.STABLE)
+                return self._finalize_gesture()
+        else:
+            # Different gesture - start transition
+            self._change_state(AggregationState.TRANSITIONING)
             
-            return None
-        
-        elif self._state == AggregationState.STABLE:
-            if self._current_candidate and label == self._current_candidate.label:
-                # Still same gesture
-                self._update_candidate(frame.frame_id, confidence, current_time)
-                return None
+            # If current candidate was substantial, finalize it first
+            if self._current_candidate.duration_frames >= self._half_stability:
+                gesture = self._finalize_gesture()
+                self._start_candidate(label, frame.gesture_type, frame.frame_id, current_time)
+                return gesture
             else:
-                # New gesture starting
-                self._change_state(AggregationState.TRACKING)
+                # Abandon short candidate, start new one
                 self._start_candidate(label, frame.gesture_type, frame.frame_id, current_time)
-                return None
         
-        elif self._state == AggregationState.TRANSITIONING:
-            # Allow brief transition period
-            if self._current_candidate and label == self._current_candidate.label:
-                self._update_candidate(frame.frame_id, confidence, current_time)
-                self._change_state(AggregationState.TRACKING)
+        return None
+    
+    def _on_stable(
+        self,
+        label: str,
+        confidence: float,
+        frame: GestureFrame,
+        current_time: float
+    ) -> Optional[RecognizedGesture]:
+        """STABLE: extend the held gesture, or start tracking a new one."""
+        if self._current_candidate and label == self._current_candidate.label:
+            # Still same gesture
+            self._update_candidate(frame.frame_id, confidence, current_time)
             return None
-        
+        else:
+            # New gesture starting
+            self._change_state(AggregationState.TRACKING)
+            self._start_candidate(label, frame.gesture_type, frame.frame_id, current_time)
+            return None
+    
+    def _on_transitioning(
+        self,
+        label: str,
+        confidence: float,
+        frame: GestureFrame,
+        current_time: float
+    ) -> Optional[RecognizedGesture]:
+        """TRANSITIONING: allow a brief transition period."""
+        if self._current_candidate and label == self._current_candidate.label:
+            self._update_candidate(frame.frame_id, confidence, current_time)
+            self._change_state(AggregationState.TRACKING)
         return None
     
     def _start_candidate(
@@ -309,27 +557,18 @@ class TemporalAggregator:
         timestamp: float
     ):
         """Start tracking a new gesture candidate."""
-        self._current_candidate = GestureCandidate(
-            label=label,
-            gesture_type=gesture_type,
-            start_frame=frame_id,
-            end_frame=frame_id,
-            frame_ids=[frame_id],
-            start_time=timestamp,
-            last_seen_time=timestamp
-        )
+        candidate = self._candidate_slot
+        candidate.reset(label, gesture_type, frame_id, timestamp)
+        self._current_candidate = candidate
     
     def _update_candidate(self, frame_id: int, confidence: float, timestamp: float):
         """Update current gesture candidate with new frame data."""
-        if self._current_candidate:
-            self._current_candidate.end_frame = frame_id
-            self._current_candidate.frame_ids.append(frame_id)
-            self._current_candidate.confidences.append(confidence)
-            self._current_candidate.peak_confidence = max(
-                self._current_candidate.peak_confidence, 
-                confidence
-            )
-            self._current_candidate.last_seen_time = timestamp
+        candidate = self._current_candidate
+        if candidate:
+            candidate.end_frame = frame_id
+            candidate.frame_ids.append(frame_id)
+            candidate.add_confidence(confidence)
+            candidate.last_seen_time = timestamp
     
     def _finalize_gesture(self) -> Optional[RecognizedGesture]:
         """Finalize current candidate into a recognized gesture."""
@@ -338,7 +577,8 @@ class TemporalAggregator:
         
         candidate = self._current_candidate
         
-        # Create recognized gesture
+        # Create recognized gesture (the candidate is discarded below, so
+        # its frame id list is handed over rather than copied)
         gesture = RecognizedGesture(
             label=candidate.label,
             gesture_type=candidate.gesture_type,
@@ -346,7 +586,7 @@ class TemporalAggregator:
             start_time=candidate.start_time,
             end_time=candidate.last_seen_time,
             frame_count=candidate.duration_frames,
-            supporting_frames=candidate.frame_ids.copy()
+            supporting_frames=candidate.frame_ids
         )
         
         # Update statistics
@@ -395,22 +635,48 @@ class TemporalAggregator:
     
     def get_buffer_size(self) -> int:
         """Get number of frames in buffer."""
-        return len(self._frame_buffer)
+        return min(self._buffered_frames, self.window_size)
+    
+    def get_landmark_window(self) -> np.ndarray:
+        """Get buffered landmarks in chronological order.
+        
+        Returns:
+            (n, 21, 3) float32 array, oldest frame first (zeros where
+            a frame had no landmarks)
+        """
+        count = self.get_buffer_size()
+        if count < self.window_size:
+            return self._landmarks_buf[:count].copy()
+        start = self._buffered_frames % self.window_size
+        return np.roll(self._landmarks_buf, -start, axis=0)
+    
+    def get_window_confidence_levels(self) -> np.ndarray:
+        """Get GestureConfidence codes for buffered frames (buffer order)."""
+        return confidence_levels(self._confidences_buf[:self.get_buffer_size()])
     
     def get_statistics(self) -> Dict:
         """Get aggregation statistics."""
         return {
             'total_frames_processed': self._frame_count,
             'total_gestures_recognized': self._total_gestures_recognized,
-            'current_state': self._state.value,
-            'buffer_size': len(self._frame_buffer),
+            'current_state': self._state.label,
+            'buffer_size': self.get_buffer_size(),
             'current_candidate': self._current_candidate.label if self._current_candidate else None
         }
     
     def clear(self):
         """Clear all buffers and reset state."""
-        self._frame_buffer.clear()
-        self._prediction_history.clear()
+        self._buffered_frames = 0
+        self._history_labels = [None] * self.window_size
+        self._history_head = 0
+        self._history_len = 0
+        self._history_seq = 0
+        self._vote_counts.clear()
+        self._vote_sums.clear()
+        self._vote_first.clear()
+        self._vote_last.clear()
+        self._leader = None
+        self._leader_stale = True
         self._state = AggregationState.IDLE
         self._current_candidate = None
         self._frame_count = 0
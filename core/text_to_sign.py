@@ -13,7 +13,11 @@ from typing import Optional, List, Tuple, Dict, Generator
 from dataclasses import dataclass, field
 from enum import Enum
 
-from .sign_vocabulary import SignVocabulary, SignDefinition, SignCategory
+from .sign_vocabulary import SignVocabulary, SignDefinition, WORDLIKE_CATEGORIES
+
+
+# Punctuation except apostrophes (compiled once, not per translation)
+_PUNCTUATION_RE = re.compile(r"[^\w\s']")
 
 
 class SignOutputType(Enum):
@@ -117,6 +121,7 @@ class TextToSignTranslator:
             "my name is": ["my", "name"],
             "what is your name": ["what", "your", "name"],
         }
+        self._phrase_version = 0  # bumped by add_phrase_pattern
     
     def translate(self, text: str, expand_fingerspelling: bool = True) -> SignSequenceResult:
         """Translate text to sign sequence.
@@ -129,13 +134,32 @@ class TextToSignTranslator:
         Returns:
             SignSequenceResult with signs to display
         """
-        result = SignSequenceResult(original_text=text)
-        
         if not text:
-            return result
+            return SignSequenceResult(original_text=text)
         
-        # Normalize text
-        text = self._normalize_text(text)
+        return self.translate_normalized(
+            self.normalize_text(text), text, expand_fingerspelling
+        )
+    
+    def translate_normalized(
+        self,
+        text: str,
+        original_text: Optional[str] = None,
+        expand_fingerspelling: bool = True
+    ) -> SignSequenceResult:
+        """Translate text that has already been through normalize_text().
+        
+        Args:
+            text: Normalized text to translate
+            original_text: Text to report as the input (defaults to `text`)
+            expand_fingerspelling: As for translate()
+            
+        Returns:
+            SignSequenceResult with signs to display
+        """
+        result = SignSequenceResult(
+            original_text=text if original_text is None else original_text
+        )
         
         # Check for complete phrase match first
         phrase_signs = self._check_phrase_match(text.lower())
@@ -208,13 +232,13 @@ class TextToSignTranslator:
         for sign in result.signs:
             yield sign
     
-    def _normalize_text(self, text: str) -> str:
+    def normalize_text(self, text: str) -> str:
         """Normalize text for translation."""
         # Remove extra whitespace
         text = " ".join(text.split())
         
         # Remove punctuation except apostrophes
-        text = re.sub(r"[^\w\s']", " ", text)
+        text = _PUNCTUATION_RE.sub(" ", text)
         
         return text.strip()
     
@@ -233,7 +257,7 @@ class TextToSignTranslator:
         """Look up word in vocabulary."""
         sign_def = self.vocabulary.get_sign_by_text(word)
         
-        if sign_def and sign_def.category in [SignCategory.WORD, SignCategory.PHRASE]:
+        if sign_def and sign_def.category in WORDLIKE_CATEGORIES:
             return SignOutput(
                 sign_id=sign_def.id,
                 text=word,
@@ -409,6 +433,22 @@ class TextToSignTranslator:
             sign_labels: List of sign labels to use
         """
         self._phrase_patterns[phrase.lower()] = sign_labels
+        self._phrase_version += 1
+    
+    def cache_key(self, text: str) -> tuple:
+        """Key under which a translation of `text` can be memoized.
+        
+        Texts with the same key translate to the same signs. The key
+        covers the normalized text and everything else the output
+        depends on (vocabulary and phrase versions, sign durations).
+        """
+        return (
+            self.normalize_text(text) if text else "",
+            self.vocabulary.version,
+            self._phrase_version,
+            self.word_sign_duration,
+            self.letter_duration,
+        )
 
 
 class SignAnimator:
@@ -0,0 +1,317 @@
+"""
+Tests for the SQLite database service.
+
+Each test runs against its own database file in a temporary directory
+(config.BASE_DIR is redirected before the service module is imported,
+so the module-level instance never touches the repository database).
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import config
+
+_TMP_DIR = tempfile.mkdtemp(prefix="signlang-db-test-")
+config.BASE_DIR = _TMP_DIR
+
+from backend.services import db as db_module  # noqa: E402
+
+
+def tearDownModule():
+    shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def collect(iterator):
+    return [row async for row in iterator]
+
+
+class DatabaseTestCase(unittest.TestCase):
+    
+    def setUp(self):
+        db_module.DB_PATH = os.path.join(_TMP_DIR, f"{self.id()}.db")
+        self.db = db_module.DatabaseService()
+        result = run(self.db.sign_up("tester", "secret123"))
+        self.user_id = result["user"]["id"]
+    
+    def save(self, count, label="A"):
+        for i in range(count):
+            run(self.db.save_translation(self.user_id, f"{label}{i}", 0.5 + i % 5 * 0.1))
+        self.db.flush()
+
+
+class TestIterTranslations(DatabaseTestCase):
+    
+    def test_pages_match_get_translations(self):
+        self.save(57)
+        # Newest first, ties on created_at broken by id
+        expected = sorted(
+            run(self.db.get_translations(self.user_id, limit=1000)),
+            key=lambda row: (row["created_at"], row["id"]), reverse=True
+        )
+        self.assertEqual(len(expected), 57)
+        for limit, offset, batch_size in ((-1, 0, 5), (20, 3, 7), (14, 0, 7), (100, 50, 4), (0, 0, 3)):
+            rows = run(collect(self.db.iter_translations(
+                self.user_id, limit=limit, offset=offset, batch_size=batch_size
+            )))
+            want = expected[offset:] if limit < 0 else expected[offset:offset + limit]
+            self.assertEqual(rows, want, (limit, offset, batch_size))
+    
+    def test_no_connection_held_between_rows(self):
+        self.save(10)
+        
+        async def consume_slowly():
+            iterators = [
+                self.db.iter_translations(self.user_id, batch_size=2)
+                for _ in range(config.DB_READ_POOL_SIZE + 2)
+            ]
+            for iterator in iterators:
+                await iterator.__anext__()
+            # Every pooled connection is back while the iterators are suspended
+            self.assertEqual(self.db._read_pool.qsize(), self.db._read_conns_opened)
+            counts = [1 + len(await collect(iterator)) for iterator in iterators]
+            self.assertEqual(counts, [10] * len(iterators))
+        
+        run(asyncio.wait_for(consume_slowly(), timeout=10))
+
+
+
+class TestSaveTranslation(DatabaseTestCase):
+    
+    def test_ids_come_from_sqlite(self):
+        async def save_many(service, label, count):
+            return await asyncio.gather(*(
+                service.save_translation(self.user_id, label, 0.9) for _ in range(count)
+            ))
+        
+        # A second service on the same file is another writer
+        other = db_module.DatabaseService()
+        results = run(save_many(self.db, "A", 40))
+        results += run(save_many(other, "B", 40))
+        results += run(save_many(self.db, "C", 40))
+        
+        ids = [result["id"] for result in results]
+        self.assertEqual(len(set(ids)), 120)
+        rows = run(self.db.get_translations(self.user_id, limit=1000))
+        self.assertEqual(sorted(row["id"] for row in rows), sorted(ids))
+        by_id = {row["id"]: row["sign_label"] for row in rows}
+        self.assertEqual([by_id[i] for i in ids], ["A"] * 40 + ["B"] * 40 + ["C"] * 40)
+
+    
+    def test_bad_row_does_not_sink_its_batch(self):
+        self.save(1, label="first")  # starts the flusher
+        
+        async def save_batch():
+            # Queue everything before the flusher can take any of it
+            with self.db._flush_lock:
+                tasks = [
+                    asyncio.ensure_future(self.db.save_translation(self.user_id, label, 0.9))
+                    for label in ("A", "B", None, "C")
+                ]
+                await asyncio.sleep(0.05)
+            return await asyncio.gather(*tasks)
+        
+        with self.assertLogs(db_module.logger, "WARNING"):
+            results = run(save_batch())
+        self.assertIn("error", results[2])
+        saved = [result["id"] for i, result in enumerate(results) if i != 2]
+        rows = run(self.db.get_translations(self.user_id))
+        self.assertEqual(sorted(row["id"] for row in rows)[1:], sorted(saved))
+        self.assertEqual(sorted(row["sign_label"] for row in rows), ["A", "B", "C", "first0"])
+
+    
+    def test_cancelled_save_is_still_written(self):
+        self.save(1, label="first")  # starts the flusher
+        
+        async def cancel_one():
+            with self.db._flush_lock:
+                cancelled = asyncio.ensure_future(self.db.save_translation(self.user_id, "X", 0.9))
+                await asyncio.sleep(0.01)
+                cancelled.cancel()
+                await asyncio.sleep(0.01)
+            return await self.db.save_translation(self.user_id, "Y", 0.9)
+        
+        self.assertTrue(run(cancel_one()).get("success"))
+        labels = {row["sign_label"] for row in run(self.db.get_translations(self.user_id))}
+        self.assertEqual(labels, {"first0", "X", "Y"})
+
+
+class TestMigrateTranslationIds(unittest.TestCase):
+    
+    def create_legacy_db(self, with_gesture_type=True):
+        import sqlite3
+        db_module.DB_PATH = os.path.join(_TMP_DIR, f"{self.id()}.db")
+        conn = sqlite3.connect(db_module.DB_PATH)
+        gesture_column = "gesture_type TEXT DEFAULT 'static'," if with_gesture_type else ""
+        conn.execute(f"""
+            CREATE TABLE translations (
+                id TEXT PRIMARY KEY, user_id TEXT NOT NULL, sign_label TEXT NOT NULL,
+                confidence REAL NOT NULL, {gesture_column}
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO translations (id, user_id, sign_label, confidence, created_at) "
+            "VALUES (?, 'u1', ?, 0.8, ?)",
+            [("uuid-b", "B", "2024-01-02 00:00:00"), ("uuid-a", "A", "2024-01-01 00:00:00")]
+        )
+        conn.commit()
+        conn.close()
+    
+    def table_info(self):
+        import sqlite3
+        conn = sqlite3.connect(db_module.DB_PATH)
+        try:
+            id_type = next(
+                c[2] for c in conn.execute("PRAGMA table_info(translations)") if c[1] == 'id'
+            )
+            rows = conn.execute(
+                "SELECT id, sign_label FROM translations ORDER BY created_at"
+            ).fetchall()
+            tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            return id_type, rows, tables
+        finally:
+            conn.close()
+    
+    def test_rebuilds_with_integer_ids(self):
+        self.create_legacy_db()
+        db_module.DatabaseService()
+        id_type, rows, tables = self.table_info()
+        self.assertEqual(id_type, "INTEGER")
+        self.assertEqual(rows, [(1, "A"), (2, "B")])
+        self.assertNotIn("translations_legacy", tables)
+    
+    def test_failed_rebuild_leaves_legacy_table(self):
+        # Copying rows fails (no gesture_type column); nothing may be kept
+        self.create_legacy_db(with_gesture_type=False)
+        with self.assertRaises(Exception):
+            db_module.DatabaseService()
+        id_type, rows, tables = self.table_info()
+        self.assertEqual(id_type, "TEXT")
+        self.assertEqual(rows, [("uuid-a", "A"), ("uuid-b", "B")])
+        self.assertNotIn("translations_legacy", tables)
+
+
+class TestTokenCaches(DatabaseTestCase):
+    
+    def test_concurrent_lookups(self):
+        tokens = [
+            run(self.db.sign_in("tester", "secret123"))["session"]["token"]
+            for _ in range(4)
+        ]
+        errors = []
+        
+        def worker(seed):
+            try:
+                for i in range(300):
+                    token = tokens[(seed + i) % len(tokens)]
+                    user = self.db.get_current_user(token)
+                    if user is None or user["id"] != self.user_id:
+                        errors.append(("valid token rejected", token))
+                    if self.db.get_current_user(f"bad-{seed}-{i}") is not None:
+                        errors.append(("bad token accepted", seed, i))
+            except Exception as e:
+                errors.append(e)
+        
+        with mock.patch.object(db_module, '_TOKEN_CACHE_MAX', 2), \
+                mock.patch.object(db_module, '_BAD_TOKEN_CACHE_MAX', 8):
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.db._token_cache), 2)
+        self.assertLessEqual(len(self.db._bad_tokens), 8)
+    
+    def test_sign_out_evicts_cached_session(self):
+        token = run(self.db.sign_in("tester", "secret123"))["session"]["token"]
+        self.assertIsNotNone(self.db.get_current_user(token))
+        run(self.db.sign_out(token))
+        self.assertIsNone(self.db.get_current_user(token))
+    
+    def test_sign_out_during_lookup_is_not_cached(self):
+        token = run(self.db.sign_in("tester", "secret123"))["session"]["token"]
+        paused = threading.Event()
+        resume = threading.Event()
+        original = db_module.DatabaseService._exec
+        
+        def slow_exec(conn, name, params=()):
+            cursor = original(conn, name, params)
+            if name == 'get_user_by_token':
+                paused.set()
+                resume.wait(10)
+            return cursor
+        
+        results = []
+        with mock.patch.object(db_module.DatabaseService, '_exec', staticmethod(slow_exec)):
+            lookup = threading.Thread(target=lambda: results.append(self.db.get_current_user(token)))
+            lookup.start()
+            self.assertTrue(paused.wait(10))
+            run(self.db.sign_out(token))
+            resume.set()
+            lookup.join(10)
+        
+        # The lookup read the session before it was revoked, but must not
+        # leave it in the cache
+        self.assertEqual(len(results), 1)
+        self.assertIsNone(self.db.get_current_user(token))
+    
+    def test_delete_user_evicts_cached_sessions(self):
+        token = run(self.db.sign_in("tester", "secret123"))["session"]["token"]
+        self.save(3)
+        self.assertIsNotNone(self.db.get_current_user(token))
+        self.assertEqual(run(self.db.delete_user(self.user_id)), {"success": True})
+        self.assertIsNone(self.db.get_current_user(token))
+        self.assertEqual(run(self.db.get_translations(self.user_id)), [])
+        self.assertIn("error", run(self.db.sign_in("tester", "secret123")))
+
+
+class TestSignIn(DatabaseTestCase):
+    
+    def add_legacy_user(self, email, password):
+        """Insert a user with an old PBKDF2 TEXT hash."""
+        salt = "00112233445566778899aabbccddeeff"
+        password_hash = db_module._pbkdf2(password.encode(), salt.encode()).hex()
+        with self.db._get_connection() as conn:
+            conn.execute(
+                "INSERT INTO users (id, email, password_hash, salt) VALUES (?, ?, ?, ?)",
+                ("legacy-id", email, password_hash, salt)
+            )
+    
+    def test_password_hashing_holds_no_connection(self):
+        self.add_legacy_user("legacy", "hunter22")
+        calls = []
+        
+        def check_no_connection_held(original):
+            def wrapper(service, *args):
+                calls.append(original.__name__)
+                self.assertFalse(service._conn_lock._is_owned())
+                self.assertEqual(service._read_pool.qsize(), service._read_conns_opened)
+                return original(service, *args)
+            return wrapper
+        
+        cls = db_module.DatabaseService
+        with mock.patch.object(cls, '_verify_password', check_no_connection_held(cls._verify_password)), \
+                mock.patch.object(cls, '_hash_password', check_no_connection_held(cls._hash_password)):
+            self.assertTrue(run(self.db.sign_in("legacy", "hunter22")).get("success"))
+        self.assertEqual(calls, ['_verify_password', '_hash_password'])
+        
+        # The upgraded hash is stored and still accepts the password
+        with self.db._get_connection() as conn:
+            stored = conn.execute("SELECT password_hash FROM users WHERE id = 'legacy-id'").fetchone()[0]
+        self.assertIsInstance(stored, bytes)
+        self.assertTrue(run(self.db.sign_in("legacy", "hunter22")).get("success"))
+        self.assertIn("error", run(self.db.sign_in("legacy", "wrong")))
+
+
+if __name__ == "__main__":
+    unittest.main()
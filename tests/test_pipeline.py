@@ -0,0 +1,203 @@
+"""
+Tests for SignLanguagePipeline frame processing.
+
+Frames carry their own timestamps (replayed video, batches), so every
+timeout decision must be made on that clock rather than wall time.
+Async mode and process_batch must give the same results as feeding
+frames one at a time in sync mode.
+"""
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from core.pipeline import PipelineConfig, PipelineMode, SignLanguagePipeline
+
+
+FPS = 30.0
+HAND = np.zeros((21, 3), dtype=np.float32)
+
+
+def letter_frames(letters, frames_per_letter=10, gap_frames=5):
+    """(label, confidence) frames spelling `letters`, with no-hand gaps."""
+    frames = []
+    for letter in letters:
+        frames.extend([(letter, 0.9)] * frames_per_letter)
+        frames.extend([(None, 0.0)] * gap_frames)
+    return frames
+
+
+class TestFrameClock(unittest.TestCase):
+    
+    def setUp(self):
+        self.pipeline = SignLanguagePipeline(PipelineConfig(stability_threshold=3))
+        self.completed = []
+        self.pipeline.set_on_translation_complete(self.completed.append)
+    
+    def replay(self, frames, start):
+        """Feed frames on a clock starting at `start`; return the end time."""
+        for i, (label, conf) in enumerate(frames):
+            landmarks = HAND if label else None
+            self.pipeline.process_frame(landmarks, None, label, conf, timestamp=start + i / FPS)
+        return start + len(frames) / FPS
+    
+    def first_completion_time(self, start, seconds):
+        """Feed no-hand frames; return the timestamp of the first completion."""
+        for i in range(int(seconds * FPS)):
+            now = start + i / FPS
+            self.pipeline.process_frame(None, None, None, 0.0, timestamp=now)
+            if self.completed:
+                return now
+        return None
+    
+    def test_sentence_timeout_follows_frame_timestamps(self):
+        # Replayed far faster than real time: only the frame clock shows
+        # the pause after the letters
+        self.pipeline.start(PipelineMode.LIVE_ACCUMULATE)
+        end = self.replay(letter_frames("HI"), start=1.0e6)
+        last_gesture = self.pipeline._last_gesture_time
+        self.assertGreater(last_gesture, 0)
+        
+        done_at = self.first_completion_time(end, seconds=5)
+        self.assertIsNotNone(done_at)
+        timeout = self.pipeline.config.sentence_timeout
+        self.assertGreaterEqual(done_at - last_gesture, timeout)
+        self.assertLess(done_at - last_gesture, timeout + 2 / FPS)
+        
+        result = self.completed[0]
+        self.assertTrue(result.text)
+        # Measured on the frame clock, not against time.monotonic()
+        self.assertLess(result.capture_duration, 10.0)
+    
+    def test_no_timeout_within_replayed_pause(self):
+        self.pipeline.start(PipelineMode.LIVE_ACCUMULATE)
+        end = self.replay(letter_frames("HI"), start=1.0e6)
+        self.assertIsNone(self.first_completion_time(end, seconds=2))
+    
+    def test_process_gesture_uses_given_timestamp(self):
+        self.pipeline.start(PipelineMode.LIVE_ACCUMULATE)
+        self.pipeline.process_gesture("A", 0.9, timestamp=500.0)
+        self.pipeline.process_gesture("B", 0.9, timestamp=500.5)
+        self.assertEqual(self.pipeline._last_gesture_time, 500.5)
+        self.assertEqual(self.pipeline.sentence_builder.constructor._last_gesture_time, 500.5)
+        self.assertIsNotNone(self.first_completion_time(501.0, seconds=3))
+
+
+def run_frames(pipeline, frames, start=100.0):
+    """Feed frames through process_frame; return gestures and final text."""
+    gestures = []
+    pipeline.set_on_gesture_recognized(
+        lambda g: gestures.append((g.label, g.frame_count, g.end_time))
+    )
+    pipeline.start(PipelineMode.LIVE_CONTINUOUS)
+    for i, (label, conf) in enumerate(frames):
+        pipeline.process_frame(HAND if label else None, None, label, conf, timestamp=start + i / FPS)
+    result = pipeline.stop_and_translate()
+    return gestures, result.text
+
+
+def worker_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("pipeline-")]
+
+
+class TestAsyncMode(unittest.TestCase):
+    
+    def make_pipeline(self, **overrides):
+        config = dict(stability_threshold=3, async_mode=True, async_queue_size=2)
+        config.update(overrides)
+        return SignLanguagePipeline(PipelineConfig(**config))
+    
+    def test_matches_sync_mode(self):
+        frames = letter_frames("HELLO", frames_per_letter=8, gap_frames=3)
+        expected = run_frames(self.make_pipeline(async_mode=False), frames)
+        self.assertTrue(expected[0])
+        for _ in range(5):
+            self.assertEqual(run_frames(self.make_pipeline(), frames), expected)
+    
+    def test_slow_aggregator_loses_no_frames(self):
+        pipeline = self.make_pipeline()
+        process = pipeline.aggregator.process_frame
+        
+        def slow_process(frame, now=None):
+            time.sleep(0.001)
+            return process(frame, now)
+        
+        pipeline.aggregator.process_frame = slow_process
+        frames = letter_frames("AB")
+        run_frames(pipeline, frames)
+        self.assertEqual(pipeline.aggregator._frame_count, len(frames))
+    
+    def test_stop_joins_workers(self):
+        pipeline = self.make_pipeline()
+        pipeline.start(PipelineMode.LIVE_CONTINUOUS)
+        self.assertEqual(len(worker_threads()), 2)
+        pipeline.stop()
+        self.assertEqual(worker_threads(), [])
+        self.assertIsNone(pipeline.process_frame(HAND, None, "A", 0.9, timestamp=1.0))
+    
+    def test_stop_releases_blocked_producer(self):
+        pipeline = self.make_pipeline()
+        release = threading.Event()
+        process = pipeline.aggregator.process_frame
+        
+        def stalled_process(frame, now=None):
+            release.wait(10)
+            return process(frame, now)
+        
+        pipeline.aggregator.process_frame = stalled_process
+        pipeline.start(PipelineMode.LIVE_CONTINUOUS)
+        
+        def produce():
+            for i in range(10):
+                pipeline.process_frame(HAND, None, "A", 0.9, timestamp=i / FPS)
+        
+        producer = threading.Thread(target=produce)
+        producer.start()
+        # The worker holds one frame and the queue is full: the producer waits
+        producer.join(0.3)
+        self.assertTrue(producer.is_alive())
+        
+        release.set()
+        pipeline.stop()
+        producer.join(5)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(worker_threads(), [])
+
+
+class TestProcessBatch(unittest.TestCase):
+    
+    def make_pipeline(self):
+        return SignLanguagePipeline(PipelineConfig(stability_threshold=3))
+    
+    def test_matches_frame_by_frame(self):
+        frames = letter_frames("HELLO", frames_per_letter=8, gap_frames=3)
+        frames += [(None, 0.0)] * 10 + [("A", 0.3)] * 5 + letter_frames("WORLD")
+        timestamps = 100.0 + np.arange(len(frames)) / FPS
+        labels = [label for label, _ in frames]
+        confidences = np.array([conf for _, conf in frames])
+        landmarks = np.stack([HAND if label else np.full((21, 3), np.nan, np.float32) for label in labels])
+        
+        for mode in (PipelineMode.LIVE_CONTINUOUS, PipelineMode.LIVE_ACCUMULATE):
+            single = self.make_pipeline()
+            single.start(mode)
+            expected = [
+                single.process_frame(
+                    HAND if label else None, None, label, conf, timestamp=float(timestamps[i])
+                )
+                for i, (label, conf) in enumerate(frames)
+            ]
+            
+            batch = self.make_pipeline()
+            batch.start(mode)
+            self.assertEqual(batch.process_batch(landmarks, labels, confidences, timestamps=timestamps), expected)
+            self.assertTrue(any(expected))
+            
+            for attr in ("frames_processed", "gestures_recognized", "current_text",
+                         "current_preview", "last_gesture", "last_update_time"):
+                self.assertEqual(getattr(batch.get_state(), attr), getattr(single.get_state(), attr), attr)
+            self.assertEqual(batch.stop_and_translate().text, single.stop_and_translate().text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Tests for the pipeline's memoized vocabulary lookups.
+
+Cached results must match an uncached lookup, including after the
+vocabulary gains custom words.
+"""
+import unittest
+
+from core.pipeline import SignLanguagePipeline
+from core.text_to_sign import TextToSignTranslator
+
+
+TEXTS = (
+    "", "!!!", "Hello", "hello", "HELLO!", "hello,  friend", "Thank you",
+    "thank, you", "I love you", "abc xyz", "123 go", "pizza night", "Pizza?",
+)
+
+
+class TestResolveLabelCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.pipeline = SignLanguagePipeline()
+    
+    def resolve(self, label):
+        return self.pipeline._resolve_label(label, self.pipeline.vocabulary.version)
+    
+    def test_matches_uncached_lookup(self):
+        for label in ("hello", "HELLO", "A", "7", "thank_you", "unknown_label"):
+            expected = self.pipeline._resolve_label_impl(label, 0)
+            self.assertEqual(self.resolve(label), expected)
+            self.assertEqual(self.resolve(label), expected)
+    
+    def test_sees_custom_words(self):
+        self.assertEqual(self.resolve("pizza_sign"), (False, None))
+        self.pipeline.vocabulary.add_custom_word("Pizza", ["pizza_sign"])
+        self.assertEqual(self.resolve("pizza_sign"), (True, "Pizza"))
+
+
+
+class TestTranslateCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.pipeline = SignLanguagePipeline()
+    
+    def assert_matches_uncached(self):
+        uncached = TextToSignTranslator(self.pipeline.vocabulary)
+        uncached._phrase_patterns = dict(self.pipeline.text_to_sign._phrase_patterns)
+        for _ in range(2):
+            for text in TEXTS:
+                self.assertEqual(
+                    self.pipeline.translate_text_to_sign(text),
+                    uncached.translate(text),
+                    repr(text)
+                )
+    
+    def test_matches_uncached_translation(self):
+        self.assert_matches_uncached()
+    
+    def test_shares_entries_between_equivalent_texts(self):
+        self.pipeline.translate_text_to_sign("Hello friend")
+        self.pipeline.translate_text_to_sign("Hello friend!")
+        self.pipeline.translate_text_to_sign("  Hello friend ")
+        info = self.pipeline._translate_cached.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+        self.assertEqual(
+            self.pipeline.translate_text_to_sign("Hello friend!").original_text,
+            "Hello friend!"
+        )
+    
+    def test_sees_vocabulary_changes(self):
+        self.assert_matches_uncached()
+        self.pipeline.vocabulary.add_custom_word("Pizza", ["pizza_sign"])
+        self.assert_matches_uncached()
+        self.pipeline.text_to_sign.add_phrase_pattern("pizza night", ["pizza_sign"])
+        self.assert_matches_uncached()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Differential tests for the sentence formatter.
+
+With pyahocorasick installed, contractions are found by an Aho-Corasick
+scan; without it, by one regex alternation. Both paths must produce
+the same text, including for overlapping keys and word boundaries.
+"""
+import random
+import re
+import unittest
+from unittest import mock
+
+from core import sentence_constructor
+from core.sentence_constructor import SentenceConstructor, _build_automaton, _make_formatter
+
+
+def regex_formatter():
+    return _make_formatter(
+        SentenceConstructor._I_RE,
+        SentenceConstructor._CONTRACTION_RE,
+        SentenceConstructor._CONTRACTION_REPLACEMENTS,
+        None
+    )
+
+
+def formatters_for(rules):
+    """(automaton, regex) formatters for a rule table, built like the class's."""
+    pattern = re.compile(
+        r'\b(?:' + '|'.join('(' + re.escape(k) + ')' for k in rules) + r')\b',
+        re.IGNORECASE
+    )
+    replacements = tuple(rules.values())
+    i_re = SentenceConstructor._I_RE
+    return (
+        _make_formatter(i_re, pattern, replacements, _build_automaton(rules)),
+        _make_formatter(i_re, pattern, replacements, None),
+    )
+
+
+# Keys that overlap and nest: one key is a prefix, suffix or infix of another
+OVERLAPPING_RULES = {
+    'A B': "<ab>", 'A': "<a>", 'B C': "<bc>", 'AB': "<AB>",
+    'B': "<b>", 'C A B': "<cab>", 'A B C D': "<abcd>", 'BC': "<BC>",
+}
+
+
+CASES = (
+    "", " ", "i", "i m", "I M here", "dont", "DONT stop", "dontt", "xdont",
+    "dont_go", "dont2", "i dont know", "wont cant", "wontcant",
+    # Overlapping keys: WERE inside THEYRE/YOURE, ILL inside YOULL
+    "were", "we re", "theyre", "youre", "youll", "ill", "ILL YOULL",
+    "theyrewere", "youre were theyre", "i'll dont", "dont's", "'dont'",
+    "dont,cant.wont", "hello  world", " leading", "trailing ", "tab\there",
+    "i\ni m", "I MI M", "i mi m", "a i m b", "cant-dont", "YoUrE",
+    # Non-ASCII text takes the regex path in both formatters
+    "café dont", "İLL", "straße youre",
+)
+
+WORDS = (
+    "i", "I", "m", "M", "dont", "DONT", "wont", "cant", "youre", "theyre",
+    "were", "we", "re", "ill", "youll", "you", "ll", "hello", "x", "7",
+)
+SEPARATORS = (" ", " ", " ", "", "  ", ",", ".", "'", "-", "_")
+
+
+def random_text(rnd: random.Random) -> str:
+    parts = []
+    for _ in range(rnd.randint(1, 8)):
+        parts.append(rnd.choice(WORDS))
+        parts.append(rnd.choice(SEPARATORS))
+    return "".join(parts)
+
+
+@unittest.skipIf(SentenceConstructor._CONTRACTION_AC is None, "pyahocorasick is not installed")
+class TestFormatterPaths(unittest.TestCase):
+    
+    def setUp(self):
+        self.automaton_format = SentenceConstructor._format_text
+        self.regex_format = regex_formatter()
+    
+    def assert_same(self, text):
+        self.assertEqual(self.automaton_format(text), self.regex_format(text), repr(text))
+    
+    def test_known_cases(self):
+        for text in CASES:
+            self.assert_same(text)
+    
+    def test_random_texts(self):
+        rnd = random.Random(7)
+        for _ in range(5000):
+            self.assert_same(random_text(rnd))
+    
+    def test_overlapping_rules(self):
+        automaton_format, regex_format = formatters_for(OVERLAPPING_RULES)
+        # The earlier rule wins at one position, and the leftmost match wins overall
+        self.assertEqual(regex_format("a b c"), "<ab> c")
+        self.assertEqual(regex_format("c a b c d"), "<cab> c d")
+        rnd = random.Random(11)
+        tokens = ("a", "b", "c", "d", "ab", "bc", "abc", "x")
+        for _ in range(5000):
+            text = "".join(rnd.choice(tokens) + rnd.choice(SEPARATORS) for _ in range(rnd.randint(1, 8)))
+            self.assertEqual(automaton_format(text), regex_format(text), repr(text))
+    
+    def test_contractions_applied(self):
+        self.assertEqual(self.automaton_format("i dont know"), "I don't know")
+        # Capitalization runs first, so a leading contraction stays lowercase
+        self.assertEqual(self.automaton_format("theyre here were not"), "they're here we're not")
+        self.assertEqual(self.automaton_format("xdont youll"), "Xdont you'll")
+
+
+class TestFormatterFallback(unittest.TestCase):
+    
+    def test_module_without_automaton(self):
+        with mock.patch.object(sentence_constructor, 'ahocorasick', None):
+            self.assertIsNone(sentence_constructor._build_automaton(["DONT"]))
+        self.assertEqual(regex_formatter()("i dont know"), "I don't know")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Tests for SignVocabulary's memoized lookups.
+
+The per-label caches and the category buckets must agree with the
+uncached implementations, including after custom words are added.
+"""
+import gc
+import unittest
+import weakref
+
+from core.sign_vocabulary import SignVocabulary, SignCategory, WORDLIKE_CATEGORIES
+
+
+LABELS = ("A", "a", "J", "z", "7", "seven", "hello", "HELLO", "thank_you", "pizza_sign", "nope")
+
+
+class TestLookupCaches(unittest.TestCase):
+    
+    def setUp(self):
+        self.vocabulary = SignVocabulary()
+    
+    def assert_matches_uncached(self):
+        vocabulary = self.vocabulary
+        for _ in range(2):
+            for label in LABELS:
+                self.assertEqual(vocabulary.gesture_to_text(label), vocabulary._gesture_to_text_impl(label))
+                self.assertEqual(vocabulary.is_word_gesture(label), vocabulary._is_word_gesture_impl(label))
+                self.assertEqual(vocabulary.is_dynamic_gesture(label), vocabulary._is_dynamic_gesture_impl(label))
+        
+        signs = list(vocabulary._signs.values())
+        self.assertEqual(
+            vocabulary.get_all_words(),
+            [sign for sign in signs if sign.category in WORDLIKE_CATEGORIES]
+        )
+        self.assertEqual(
+            vocabulary.get_all_letters(),
+            [sign for sign in signs if sign.category is SignCategory.LETTER]
+        )
+    
+    def test_custom_words_invalidate_caches(self):
+        self.assert_matches_uncached()
+        self.assertFalse(self.vocabulary.is_word_gesture("pizza_sign"))
+        version = self.vocabulary.version
+        
+        self.vocabulary.add_custom_word("Pizza", ["pizza_sign"])
+        self.assertGreater(self.vocabulary.version, version)
+        self.assertTrue(self.vocabulary.is_word_gesture("pizza_sign"))
+        self.assertEqual(self.vocabulary.gesture_to_text("pizza_sign"), "Pizza")
+        self.assert_matches_uncached()
+    
+    def test_instances_do_not_share_custom_words(self):
+        self.vocabulary.add_custom_word("Pizza", ["pizza_sign"])
+        self.assertIsNone(SignVocabulary().get_sign_by_gesture("pizza_sign"))
+
+    
+    def test_queries_are_class_methods(self):
+        class UpperVocabulary(SignVocabulary):
+            def gesture_to_text(self, gesture_label):
+                return super().gesture_to_text(gesture_label).upper()
+        
+        vocabulary = UpperVocabulary()
+        vocabulary.add_custom_word("Pizza", ["pizza_sign"])
+        self.assertEqual(vocabulary.gesture_to_text("pizza_sign"), "PIZZA")
+        self.assertNotIn("gesture_to_text", vars(vocabulary))
+    
+    def test_freed_without_cycle_collection(self):
+        vocabulary = SignVocabulary()
+        vocabulary.is_word_gesture("hello")
+        ref = weakref.ref(vocabulary)
+        gc.disable()
+        try:
+            del vocabulary
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+
+
+if __name__ == "__main__":
+    unittest.main()
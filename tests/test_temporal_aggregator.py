@@ -0,0 +1,290 @@
+"""
+Differential tests for TemporalAggregator voting.
+
+The aggregator keeps running per-label tallies over a ring buffer; these
+tests replay random streams through it and through reference aggregators
+that keep a plain deque and rescan it on every vote:
+
+- BruteForceAggregator scores with exact (rational) sums and breaks ties
+  by first position in the window, the rule the tallies implement, so
+  its results must match exactly.
+- RescanAggregator is the original float voting code. Its left-to-right
+  sums can differ in the last bit for equal multisets, so it is compared
+  on streams where that cannot decide a winner (equal or continuous
+  confidences), with confidences compared approximately.
+"""
+import random
+import unittest
+from collections import deque
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple
+
+from core.gesture_sequence import GestureFrame, GestureType
+from core.temporal_aggregator import TemporalAggregator
+
+
+LABELS = ("A", "B", "C", "HELLO")
+
+
+class _DequeAggregator(TemporalAggregator):
+    """Aggregator whose prediction history is a plain deque."""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._prediction_history = deque(maxlen=self.window_size)
+    
+    def _push_prediction(self, label: str, confidence: float):
+        self._prediction_history.append((label, confidence))
+    
+    def clear(self):
+        super().clear()
+        self._prediction_history.clear()
+
+
+class BruteForceAggregator(_DequeAggregator):
+    """Reference: exact sums, ties to the earliest label in the window."""
+    
+    def _perform_voting(self) -> Tuple[Optional[str], float]:
+        history = self._prediction_history
+        if len(history) < 2:
+            return None, 0.0
+        
+        totals: Dict[str, Fraction] = {}
+        counts: Dict[str, int] = {}
+        for label, confidence in history:   # oldest first
+            totals[label] = totals.get(label, 0) + Fraction(confidence)
+            counts[label] = counts.get(label, 0) + 1
+        
+        # Insertion order is first-appearance order, so only a strictly
+        # greater score replaces the best
+        best_label = None
+        best_total = 0
+        for label, total in totals.items():
+            if total > best_total:
+                best_label, best_total = label, total
+        if best_label is None:
+            return None, 0.0
+        
+        count = counts[best_label]
+        consistency = count / len(history)
+        if consistency < 0.4:
+            return None, 0.0
+        avg_confidence = float(best_total) / count
+        return best_label, min(1.0, avg_confidence * (0.5 + 0.5 * consistency))
+
+
+class RescanAggregator(_DequeAggregator):
+    """Reference: the original float voting code."""
+    
+    def _perform_voting(self) -> Tuple[Optional[str], float]:
+        if len(self._prediction_history) < 2:
+            return None, 0.0
+        
+        label_votes: Dict[str, List[float]] = {}
+        for label, confidence in self._prediction_history:
+            if label not in label_votes:
+                label_votes[label] = []
+            label_votes[label].append(confidence)
+        
+        best_label = None
+        best_score = 0.0
+        for label, confidences in label_votes.items():
+            count = len(confidences)
+            score = count * (sum(confidences) / count)
+            if score > best_score:
+                best_score = score
+                best_label = label
+        
+        if best_label is None:
+            return None, 0.0
+        
+        label_confidences = label_votes[best_label]
+        consistency = len(label_confidences) / len(self._prediction_history)
+        avg_confidence = sum(label_confidences) / len(label_confidences)
+        if consistency < 0.4:
+            return None, 0.0
+        
+        final_confidence = avg_confidence * (0.5 + 0.5 * consistency)
+        return best_label, min(1.0, final_confidence)
+
+
+def make_stream(seed: int, length: int, confidence=None, quantized=True) -> List[Tuple[Optional[str], float]]:
+    """Random (label, confidence) stream; label None means no hand.
+    
+    Confidences are quantized to 0.05 steps (or fixed) so exact score
+    ties between labels are common, unless `quantized` is False.
+    """
+    rnd = random.Random(seed)
+    stream = []
+    for _ in range(length):
+        if rnd.random() < 0.05:
+            stream.append((None, 0.0))
+            continue
+        label = rnd.choice(LABELS)
+        if confidence is not None:
+            conf = confidence
+        elif quantized:
+            conf = round(rnd.randint(6, 20) * 0.05, 2)
+        else:
+            conf = rnd.uniform(0.3, 1.0)
+        stream.append((label, conf))
+    return stream
+
+
+def replay(aggregator: TemporalAggregator, stream, clear_every: int = 0) -> list:
+    """Feed a stream and record the vote and any gesture at each frame."""
+    trace = []
+    for i, (label, conf) in enumerate(stream):
+        if clear_every and i % clear_every == clear_every - 1:
+            aggregator.clear()
+        frame = GestureFrame(
+            timestamp=i / 30.0,
+            frame_id=0,
+            predicted_label=label,
+            confidence=conf,
+            gesture_type=GestureType.STATIC,
+            hand_detected=label is not None
+        )
+        gesture = aggregator.process_frame(frame)
+        if gesture is not None:
+            gesture = (gesture.label, gesture.frame_count, gesture.confidence)
+        trace.append((aggregator.get_current_prediction(), gesture))
+    return trace
+
+
+CONFIGS = [
+    dict(window_size=window_size, stability_threshold=stability)
+    for window_size in (2, 3, 5, 8, 15, 20)
+    for stability in (1, 2, 5)
+]
+
+
+class TestVotingMatchesBruteForce(unittest.TestCase):
+    
+    def assert_same_trace(self, stream, **config):
+        expected = replay(BruteForceAggregator(**config), stream, clear_every=97)
+        actual = replay(TemporalAggregator(**config), stream, clear_every=97)
+        for i, (want, got) in enumerate(zip(expected, actual)):
+            self.assertEqual(got, want, f"frame {i} with {config}")
+    
+    def test_quantized_confidences(self):
+        for config in CONFIGS:
+            for seed in range(10):
+                self.assert_same_trace(make_stream(seed * 101 + config['window_size'], 300), **config)
+    
+    def test_equal_confidences(self):
+        # Every score tie is exact, so the winner depends only on the
+        # tie-break rule (earliest label in the current window)
+        for config in CONFIGS:
+            for seed in range(5):
+                self.assert_same_trace(make_stream(seed, 300, confidence=0.9), **config)
+    
+    def test_continuous_confidences(self):
+        for config in CONFIGS:
+            for seed in range(5):
+                self.assert_same_trace(make_stream(seed, 300, quantized=False), **config)
+
+
+class TestVotingMatchesOriginal(unittest.TestCase):
+    
+    def assert_same_decisions(self, stream, **config):
+        expected = replay(RescanAggregator(**config), stream)
+        actual = replay(TemporalAggregator(**config), stream)
+        for i, (want, got) in enumerate(zip(expected, actual)):
+            (want_label, want_conf), want_gesture = want
+            (got_label, got_conf), got_gesture = got
+            message = f"frame {i} with {config}"
+            self.assertEqual(got_label, want_label, message)
+            self.assertAlmostEqual(got_conf, want_conf, places=12, msg=message)
+            self.assertEqual(got_gesture is None, want_gesture is None, message)
+            if got_gesture is not None:
+                self.assertEqual(got_gesture[:2], want_gesture[:2], message)
+                self.assertAlmostEqual(got_gesture[2], want_gesture[2], places=12, msg=message)
+    
+    def test_equal_confidences(self):
+        for config in CONFIGS:
+            for seed in range(5):
+                self.assert_same_decisions(make_stream(seed, 300, confidence=0.9), **config)
+    
+    def test_continuous_confidences(self):
+        for config in CONFIGS:
+            for seed in range(5):
+                self.assert_same_decisions(make_stream(seed, 300, quantized=False), **config)
+
+
+class TestVotingTallies(unittest.TestCase):
+    
+    def test_tallies_match_window(self):
+        for window_size in (1, 2, 5, 15):
+            aggregator = TemporalAggregator(window_size=window_size)
+            window = deque(maxlen=window_size)
+            for seq, (label, conf) in enumerate(make_stream(window_size, 400)):
+                if label is None:
+                    continue
+                aggregator._push_prediction(label, conf)
+                window.append((label, conf))
+                
+                counts: Dict[str, int] = {}
+                totals: Dict[str, Fraction] = {}
+                for item_label, item_conf in window:
+                    counts[item_label] = counts.get(item_label, 0) + 1
+                    totals[item_label] = totals.get(item_label, 0) + Fraction(item_conf)
+                self.assertEqual(aggregator._vote_counts, counts)
+                self.assertEqual(
+                    {key: Fraction(units, 1 << 1074) for key, units in aggregator._vote_sums.items()},
+                    totals
+                )
+                # The tracked leader is what a full rescan of the tallies finds
+                if not aggregator._leader_stale:
+                    self.assertEqual(aggregator._leader, aggregator._find_leader())
+                
+                # First positions keep window order
+                order = sorted(aggregator._vote_first, key=aggregator._vote_first.get)
+                self.assertEqual(order, list(dict.fromkeys(item for item, _ in window)))
+    
+    def test_tie_goes_to_earliest_label_in_window(self):
+        aggregator = TemporalAggregator(window_size=4, min_confidence=0.5)
+        for label in ("B", "A", "A", "B"):
+            aggregator._push_prediction(label, 0.9)
+        self.assertEqual(aggregator.get_current_prediction()[0], "B")
+        
+        # Evicting the oldest B leaves A first in the window
+        aggregator._push_prediction("C", 0.9)
+        self.assertEqual(aggregator._perform_voting()[0], "A")
+        aggregator._push_prediction("B", 0.9)
+        self.assertEqual(aggregator._perform_voting()[0], "B")
+    
+    def test_min_confidence_can_change_after_construction(self):
+        aggregator = TemporalAggregator(window_size=5, min_confidence=0.5)
+        aggregator.min_confidence = 0.95
+        stream = [("A", 0.9)] * 4
+        self.assertTrue(all(vote == (None, 0.0) for vote, _ in replay(aggregator, stream)))
+        
+        aggregator.min_confidence = 0.5
+        votes = [vote for vote, _ in replay(aggregator, stream)]
+        self.assertEqual(votes[-1][0], "A")
+    
+    def test_single_label_needs_weight(self):
+        aggregator = TemporalAggregator(window_size=3, min_confidence=0.0)
+        aggregator._push_prediction("A", 0.0)
+        aggregator._push_prediction("A", 0.0)
+        self.assertEqual(aggregator.get_current_prediction(), (None, 0.0))
+        aggregator._push_prediction("A", 0.3)
+        self.assertEqual(aggregator.get_current_prediction()[0], "A")
+        # Evicting the leader forces a rescan with a single label left
+        aggregator._push_prediction("A", 0.6)
+        self.assertEqual(aggregator.get_current_prediction()[0], "A")
+    
+    def test_clear_resets_history(self):
+        aggregator = TemporalAggregator(window_size=3)
+        for label in ("A", "A", "B"):
+            aggregator._push_prediction(label, 0.9)
+        aggregator.clear()
+        self.assertEqual(aggregator.get_current_prediction(), (None, 0.0))
+        aggregator._push_prediction("B", 0.9)
+        aggregator._push_prediction("B", 0.9)
+        self.assertEqual(aggregator.get_current_prediction()[0], "B")
+
+
+if __name__ == "__main__":
+    unittest.main()
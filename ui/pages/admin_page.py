@@ -105,6 +105,8 @@ class AdminPage(QWidget):
         
         # Load Users
         try:
+            # Commit queued translation writes so the tables are current
+            self.db.flush()
             with self.db._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT id, email, created_at FROM users ORDER BY created_at DESC")
@@ -151,8 +153,9 @@ class AdminPage(QWidget):
         if QMessageBox.question(self, "Confirm", f"Delete user {email}?") == QMessageBox.Yes:
             user_id = self.users_table.item(rows[0].row(), 0).text()
             try:
-                with self.db._get_connection() as conn:
-                    conn.execute("DELETE FROM users WHERE id=?", (user_id,))
+                result = self.db._sync_delete_user(user_id)
+                if "error" in result:
+                    raise RuntimeError(result["error"])
                 self.refresh_all()
             except Exception as e:
                 QMessageBox.warning(self, "Error", str(e))
@@ -164,6 +167,7 @@ class AdminPage(QWidget):
         if QMessageBox.question(self, "Confirm", "Delete selected translation?") == QMessageBox.Yes:
             tid = self.trans_table.item(rows[0].row(), 0).data(Qt.UserRole)
             try:
+                self.db.flush()
                 with self.db._get_connection() as conn:
                     conn.execute("DELETE FROM translations WHERE id=?", (tid,))
                 self.refresh_all()
@@ -18,7 +18,7 @@ from datetime import datetime
 class HistoryItem(QFrame):
     """Single history entry card."""
     
-    delete_requested = Signal(str)  # translation_id
+    delete_requested = Signal(object)  # translation_id (int)
     
     def __init__(self, data, parent=None):
         super().__init__(parent)
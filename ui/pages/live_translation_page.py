@@ -776,7 +776,7 @@ class LiveTranslationPage(QWidget):
         self.gesture_display.update_gesture(
             gesture.label,
             gesture.confidence,
-            gesture.gesture_type.value
+            gesture.gesture_type.label
         )
     
     def _on_text_updated(self, text: str, preview: str):